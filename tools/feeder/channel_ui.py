@@ -550,6 +550,8 @@ class ChannelRow(QtWidgets.QWidget):
 
         self.val = QtWidgets.QLabel("1500")
         self.val.setFixedHeight(WIDGET_HEIGHT)
+        # Value last written to bar/val, so show_value can skip repeats
+        self._shown_value = None
 
         self.src = NoWheelComboBox()
         self.src.addItems(SRC_CHOICES)
@@ -647,6 +649,8 @@ class ChannelRow(QtWidgets.QWidget):
         # Update progress bar range based on min/max values
         def update_bar_range():
             self.bar.setRange(self.minBox.value(), self.maxBox.value())
+            # The bar may have clamped its value; write the next one regardless
+            self._shown_value = None
 
         self.minBox.valueChanged.connect(update_bar_range)
         self.maxBox.valueChanged.connect(update_bar_range)
@@ -695,6 +699,8 @@ class ChannelRow(QtWidgets.QWidget):
         layout.setColumnStretch(13, 1)  # Column 13 absorbs extra space
 
         # Connect signals
+        # Connected first so the cached settings are current for other listeners
+        self.changed.connect(self._refresh_params)
         self.nameBox.textChanged.connect(self.changed.emit)
         self.src.currentIndexChanged.connect(self._update_visual_state)
         self.rotaryBox.toggled.connect(self._update_visual_state)
@@ -736,6 +742,7 @@ class ChannelRow(QtWidgets.QWidget):
         else:
             self._multi_button_current_value = None
         self._active_multibutton_dialog = None  # Reference to active dialog for mapping
+        self._refresh_params()
 
     def _on_map(self):
         """Handle map button click."""
@@ -893,12 +900,6 @@ class ChannelRow(QtWidgets.QWidget):
         # Hide Map button when multi is selected
         self.mapBtn.setVisible(not is_multi)
 
-        # Set default output value based on mapped state
-        if not is_mapped:
-            default_val = 1000
-            self.bar.setValue(default_val)
-            self.val.setText(str(default_val))
-
     def _on_toggle_changed(self):
         """Handle toggle checkbox - enable/disable toggle group box based on toggle state."""
         is_toggle_checked = self.toggleBox.isChecked()
@@ -913,9 +914,27 @@ class ChannelRow(QtWidgets.QWidget):
         self._update_visual_state()
         self.changed.emit()
 
+    def _refresh_params(self):
+        """Snapshot the settings compute() uses so it doesn't query the widgets every tick."""
+        self._params = (
+            self.src.currentText(),
+            self.idxBox.value(),
+            self.inv.isChecked(),
+            self.minBox.value(),
+            self.midBox.value(),
+            self.maxBox.value(),
+            self.expoBox.value(),
+            self.rotaryBox.isChecked(),
+            self.rotaryStopsBox.value(),
+            self.toggleBox.isChecked(),
+        )
+
     def compute(self, axes, btns):
         """Compute output value based on current joystick state.
 
+        The row's bar and label are not touched here; Main shows the value
+        (after toggle groups are applied) via show_value at its UI rate.
+
         Args:
             axes: List of axis values
             btns: List of button states
@@ -923,15 +942,7 @@ class ChannelRow(QtWidgets.QWidget):
         Returns:
             Channel output value (1000-2000)
         """
-        src = self.src.currentText()
-        idx = self.idxBox.value()
-        inv = self.inv.isChecked()
-        mn = self.minBox.value()
-        ct = self.midBox.value()
-        mx = self.maxBox.value()
-        expo = self.expoBox.value()
-        rotary = self.rotaryBox.isChecked()
-        rotary_stops = self.rotaryStopsBox.value()
+        src, idx, inv, mn, ct, mx, expo, rotary, rotary_stops, toggle = self._params
 
         # Handle button index changes
         if idx != self._prev_btn_idx:
@@ -955,7 +966,7 @@ class ChannelRow(QtWidgets.QWidget):
                     out = int(mn + self._btn_rotary_state * stop_value)
                 else:
                     out = mn
-            elif self.toggleBox.isChecked():
+            elif toggle:
                 # Toggle mode: on/off state
                 if self._btn_last == 0 and v == 1:
                     self._btn_toggle_state = 0 if self._btn_toggle_state else 1
@@ -1012,10 +1023,21 @@ class ChannelRow(QtWidgets.QWidget):
             # src == "none": non-mapped channel
             out = mn
 
-        self.bar.setValue(out)
-        self.val.setText(str(out))
         return out
 
+    def show_value(self, value):
+        """Show an output value in the row's bar and label.
+
+        Both widgets are left alone when the value is the one already shown.
+
+        Args:
+            value: Channel value in microseconds
+        """
+        if value != self._shown_value:
+            self._shown_value = value
+            self.bar.setValue(value)
+            self.val.setText(str(value))
+
     def to_cfg(self):
         """Convert current settings to configuration dictionary.
 
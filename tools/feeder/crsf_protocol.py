@@ -6,8 +6,12 @@ This module contains all CRSF protocol-related functionality including:
 - CRC8 calculation
 - Frame building and packing
 - Channel value conversion
+- Link statistics decoding
 """
 
+import struct
+from typing import NamedTuple
+
 # CRSF Protocol Constants
 CRSF_ADDRESS_FLIGHT_CONTROLLER = 0xC8
 CRSF_FRAMETYPE_RC_CHANNELS_PACKED = 0x16
@@ -25,6 +29,26 @@ CRSF_ADDRESS_CRSF_TRANSMITTER = 0xEE
 CRSF_ADDRESS_TRANSMITTER_LEGACY = 0xEA
 CRSF_ADDRESS_ELRS_LUA = 0xEF
 
+# crsf_link_statistics_t (10 bytes), signed where the value is dBm/dB
+_LINK_STATS_STRUCT = struct.Struct("<bbBbBBBbBb")
+
+# Display names of the LinkStats fields, in the same order
+LINK_STATS_LABELS = ("1RSS", "2RSS", "LQ", "RSNR", "FLAGS", "RFMD", "TPWR", "TRSS", "TLQ", "TSNR")
+
+
+class LinkStats(NamedTuple):
+    """Decoded CRSF LINK_STATISTICS payload, fields in wire order."""
+    rss1: int
+    rss2: int
+    lq: int
+    rsnr: int
+    flags: int
+    rfmd: int
+    tpwr: int
+    trss: int
+    tlq: int
+    tsnr: int
+
 
 def crc8_d5(data: bytes) -> int:
     """Calculate CRC8 with polynomial 0xD5 for CRSF frames."""
@@ -127,6 +151,18 @@ def build_crsf_frame(ftype: int, payload: bytes) -> bytes:
     return bytes(frame)
 
 
+def unpack_link_statistics(payload: bytes) -> LinkStats:
+    """Unpack a CRSF LINK_STATISTICS payload.
+
+    Args:
+        payload: At least 10 bytes of link statistics data
+
+    Returns:
+        LinkStats tuple
+    """
+    return LinkStats._make(_LINK_STATS_STRUCT.unpack_from(payload))
+
+
 def unpack_crsf_channels(payload: bytes) -> list:
     """Unpack 16 channels from 22-byte CRSF RC_CHANNELS payload.
 
@@ -1,20 +1,27 @@
 #!/usr/bin/env python3
 # ELRS Calibration GUI + Telemetry (PyQt5)
 # pip install pyqt5 pygame pyserial
+# Optional: pip install orjson (faster calib.json reads/writes)
 
 import sys
+import atexit
 import json
 import time
 import re
 import threading
+import queue
 import csv
 import os
+import platform
 import tempfile
 import shutil
+import functools
+import weakref
+from collections import OrderedDict, deque
 from datetime import datetime
 from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtGui import QIcon, QPalette, QColor, QPixmap, QPainter, QPolygon, QPen, QBrush
-from PyQt5.QtCore import QPoint, Qt
+from PyQt5.QtGui import QIcon, QPalette, QColor, QPixmap, QImage, QPainter, QPolygon, QPen, QBrush, QFont
+from PyQt5.QtCore import QPoint, Qt, QSignalBlocker, QStandardPaths
 
 # Import from refactored modules
 from crsf_protocol import *
@@ -25,6 +32,22 @@ from channel_ui import ChannelRow, SRC_CHOICES
 from config_manager import ConfigManager, get_available_ports, DEFAULT_BAUD, CHANNELS, DEFAULT_CFG
 from version import VERSION, GIT_SHA
 
+# orjson is optional: when installed it is used to read and write calib.json,
+# otherwise the stdlib json module is used
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+IS_WINDOWS = platform.system() == "Windows"
+if IS_WINDOWS:
+    from ctypes import windll, c_int, byref, sizeof
+
+# Path to icon.ico, handling both PyInstaller bundle and normal execution.
+# PyInstaller creates a temp folder and stores its path in _MEIPASS.
+ICON_PATH = os.path.join(
+    getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__))), 'icon.ico')
+
 # Map known field names to units for numeric display in the UI
 UNIT_MAP = {
     'max power': 'mW',
@@ -44,10 +67,139 @@ TELEMETRY_UNIT_MAP = {
 }
 
 SEND_HZ = 60
+# Unchanged channels are still handed to the serial thread this often; it
+# stops transmitting after 1 s without joystick updates
+CH_KEEPALIVE_S = 0.25
+# Interval of the slow UI housekeeping timer (_ui_tick)
+UI_TICK_MS = 100
+# Console keeps at most this many lines; older lines are dropped
+LOG_MAX_LINES = 2000
+# Debug messages arriving within this window are appended in one batch
+LOG_FLUSH_MS = 50
+# Telemetry labels are repainted at most once per this many ms (~30 Hz)
+TEL_UI_MS = 33
+# Channel bars and stick visualizers are repainted at most once per this
+# many ms (20 Hz); channels are still computed and sent at SEND_HZ
+CH_UI_MS = 50
+# Seconds of CSV rows the writer thread collects before each write
+CSV_WRITE_PERIOD = 0.5
+# Rows that may wait for the writer thread (about 7 minutes at 10Hz) before
+# new rows are dropped, so a stalled disk can't grow memory without bound
+CSV_QUEUE_MAX = 4096
+
+# Numeric fields with more values than this get a spin box instead of a combo
+NUMERIC_COMBO_MAX_ITEMS = 32
+
+# Matches option strings that already carry a unit or label (e.g. "25mW", "50Hz")
+_has_letter = re.compile(r'[A-Za-z%]').search
+
+# Label stylesheets, built once and reused on every status transition
+STYLE_RED_BOLD = "color: red; font-weight: bold;"
+STYLE_WHITE_BOLD = "color: white; font-weight: bold;"
+STYLE_TEL_STALE = "color: #888888;"
+STYLE_TEL_LIVE = "color: #e0e0e0;"
+
+
+def _config_field_signature(field, is_folder):
+    """Describe the shape a config tab row is built from.
+
+    Two fields with the same signature produce identical widgets apart from the
+    current value, so the existing row can be kept and only its value updated.
+
+    Args:
+        field: Parsed parameter field dict
+        is_folder: Whether the field owns a group box (folder header)
+
+    Returns:
+        Hashable tuple
+    """
+    ftype = field.get('type', 0)
+    if ftype == 9:
+        extra = tuple(field.get('values', []))
+    elif 0 <= ftype <= 8:
+        extra = (field.get('min'), field.get('max'), field.get('step'))
+    elif ftype == 11:
+        extra = is_folder
+    elif ftype == 12:
+        extra = field.get('value', '')
+    else:
+        extra = None
+    return (ftype, field.get('parent', 0), field.get('name', ''), extra)
+
+
+@functools.lru_cache(maxsize=512)
+def _unit_for(name):
+    """Return the display unit for a field name, or None."""
+    return UNIT_MAP.get(name.strip().lower())
+
+
+@functools.lru_cache(maxsize=512)
+def _numeric_combo_items(minv, maxv, stepv, unit):
+    """Build the items for a numeric field's combo box.
+
+    Fields that share limits and unit share the cached result. Fields with
+    more than NUMERIC_COMBO_MAX_ITEMS values get a spin box instead, so the
+    range is always small.
+
+    Args:
+        minv: Minimum value
+        maxv: Maximum value
+        stepv: Step between values (> 0)
+        unit: Unit suffix for the display strings, or None
+
+    Returns:
+        Tuple of (display_strings, values), index-aligned; values is a range
+        so values.index() is O(1)
+    """
+    values = range(minv, maxv + 1, stepv)
+    if unit:
+        display_strings = tuple([f"{val}{unit}" for val in values])
+    else:
+        display_strings = tuple(map(str, values))
+    return display_strings, values
+
+
+def _value_index(values, value):
+    """Combo index of a numeric field value.
+
+    Args:
+        values: The combo's item values (range or tuple)
+        value: Device value to look up
+
+    Returns:
+        Index of value, or 0 if it isn't one of the combo's values
+    """
+    try:
+        return values.index(value)
+    except ValueError:
+        return 0
+
+
+# CRSF link statistics TX power enum -> milliwatts
+TPWR_MW = {1: "10", 2: "25", 3: "100", 4: "500", 5: "1000",
+           6: "2000", 7: "250", 8: "50"}
+
 
 def tpwr_to_mw(crsfpower):
-    return {1: "10", 2: "25", 3: "100", 4: "500", 5: "1000",
-            6: "2000", 7: "250", 8: "50"}.get(crsfpower, "Unknown")
+    return TPWR_MW.get(crsfpower, "Unknown")
+
+
+def _telemetry_formatter(key):
+    """Build the function that turns a raw link stats value into label text.
+
+    Args:
+        key: Telemetry label name (e.g. '1RSS')
+
+    Returns:
+        Callable taking the raw value and returning the display string
+    """
+    unit = TELEMETRY_UNIT_MAP.get(key)
+    if key == 'TPWR':
+        # TPWR is an enum; show the power it stands for
+        return lambda v: f"{tpwr_to_mw(v)} {unit}"
+    if unit:
+        return f"{{}} {unit}".format
+    return str
 
 
 class NoWheelComboBox(QtWidgets.QComboBox):
@@ -58,6 +210,37 @@ class NoWheelComboBox(QtWidgets.QComboBox):
         event.ignore()
 
 
+class NoWheelSpinBox(QtWidgets.QSpinBox):
+    """QSpinBox that ignores mouse wheel events."""
+
+    def wheelEvent(self, event):
+        """Ignore wheel events to prevent accidental value changes."""
+        event.ignore()
+
+
+class _ConfigRow(QtWidgets.QWidget):
+    """Config tab row: a field label followed by its combo (or spin) box.
+
+    The row is created with just the label and acts as a placeholder until
+    set_combo() adds the combo box.
+    """
+
+    def __init__(self, label_text, min_height=0):
+        super().__init__()
+        self.combo = None
+        self._layout = QtWidgets.QHBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        self._layout.addWidget(QtWidgets.QLabel(label_text))
+        self._layout.addStretch()
+        self.setMinimumHeight(min_height)
+
+    def set_combo(self, combo):
+        """Place the value widget after the label and drop the placeholder height."""
+        self.combo = combo
+        self._layout.insertWidget(1, combo)
+        self.setMinimumHeight(0)
+
+
 class JoystickVisualizer(QtWidgets.QWidget):
     """Visual joystick position indicator"""
     def __init__(self, h_channel=1, v_channel=2):
@@ -70,6 +253,13 @@ class JoystickVisualizer(QtWidgets.QWidget):
         self.v_channel = v_channel  # Vertical channel number (for left label)
         self.setMinimumSize(150, 170)  # Extra height for bottom label
         self.setMaximumSize(200, 220)  # Extra height for bottom label
+        # Frame, crosshair and labels only change with size/font, so they are
+        # rendered to a pixmap once and blitted under the stick on each paint
+        self._background = None
+        self._last_values = None
+        # Stick marker pen/brush, built once rather than on every paint
+        self._stick_pen = QPen(QColor("#1e88e5"), 2)
+        self._stick_brush = QBrush(QColor("#1e88e5"))
 
     def set_values(self, h_val, v_val, h_mapped=True, v_mapped=True):
         """Update joystick position (1000-2000 range)
@@ -80,22 +270,55 @@ class JoystickVisualizer(QtWidgets.QWidget):
             h_mapped: Whether horizontal channel is mapped
             v_mapped: Whether vertical channel is mapped
         """
+        values = (h_val, v_val, h_mapped, v_mapped)
+        if values == self._last_values:
+            return
+        self._last_values = values
         self.h_value = h_val
         self.v_value = v_val
         self.h_mapped = h_mapped
         self.v_mapped = v_mapped
         self.update()
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() in (QtCore.QEvent.FontChange, QtCore.QEvent.StyleChange):
+            self._background = None
+        super().changeEvent(event)
 
-        # Get widget dimensions
+    def _geometry(self):
+        """Side length and top-left corner of the stick square.
+
+        Returns:
+            Tuple (size, offset_x, offset_y)
+        """
         width = self.width()
         height = self.height()
         size = min(width, height) - 35  # Space for labels (left + bottom)
         offset_x = (width - size) // 2 + 8  # Small offset for left label
         offset_y = 5  # Top margin, leaving room for bottom label
+        return size, offset_x, offset_y
+
+    def _render_background(self, size, offset_x, offset_y):
+        """Draw the static parts of the indicator into a pixmap.
+
+        Args:
+            size: Side length of the stick square
+            offset_x: Left edge of the stick square
+            offset_y: Top edge of the stick square
+
+        Returns:
+            Transparent QPixmap the size of the widget
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw outer square (dead zone indicator)
         painter.setPen(QPen(QColor("#555555"), 2))
@@ -110,6 +333,29 @@ class JoystickVisualizer(QtWidgets.QWidget):
         painter.drawLine(center_x - crosshair_extent, center_y, center_x + crosshair_extent, center_y)
         painter.drawLine(center_x, center_y - crosshair_extent, center_x, center_y + crosshair_extent)
 
+        # Draw channel labels
+        painter.setPen(QPen(QColor("#e0e0e0")))
+        font = QFont(self.font())
+        font.setPointSize(8)
+        painter.setFont(font)
+
+        # Left label (vertical channel)
+        painter.drawText(0, offset_y, offset_x - 5, size, Qt.AlignRight | Qt.AlignVCenter, f"{self.v_channel}")
+
+        # Bottom label (horizontal channel)
+        painter.drawText(offset_x, offset_y + size + 5, size, 20, Qt.AlignHCenter | Qt.AlignTop, f"{self.h_channel}")
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, event):
+        size, offset_x, offset_y = self._geometry()
+        if self._background is None or self._background.devicePixelRatio() != self.devicePixelRatioF():
+            self._background = self._render_background(size, offset_x, offset_y)
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.drawPixmap(0, 0, self._background)
+
         # Draw stick position indicator if at least one channel is mapped
         if self.h_mapped or self.v_mapped:
             # Calculate stick position (1000-2000 maps to 0-size)
@@ -126,22 +372,10 @@ class JoystickVisualizer(QtWidgets.QWidget):
             stick_y = max(offset_y, min(offset_y + size, stick_y))
 
             # Draw circle for any mapped channel(s)
-            painter.setPen(QPen(QColor("#1e88e5"), 2))
-            painter.setBrush(QBrush(QColor("#1e88e5")))
+            painter.setPen(self._stick_pen)
+            painter.setBrush(self._stick_brush)
             painter.drawEllipse(stick_x - 8, stick_y - 8, 16, 16)
 
-        # Draw channel labels
-        painter.setPen(QPen(QColor("#e0e0e0")))
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
-
-        # Left label (vertical channel)
-        painter.drawText(0, offset_y, offset_x - 5, size, Qt.AlignRight | Qt.AlignVCenter, f"{self.v_channel}")
-
-        # Bottom label (horizontal channel)
-        painter.drawText(offset_x, offset_y + size + 5, size, 20, Qt.AlignHCenter | Qt.AlignTop, f"{self.h_channel}")
-
 
 class Main(QtWidgets.QWidget):
     def __init__(self):
@@ -157,14 +391,51 @@ class Main(QtWidgets.QWidget):
         self._set_dark_title_bar()
         self.cfg = DEFAULT_CFG.copy()
         self._load_cfg()
+        # Config writes are coalesced: each save restarts the timer and the
+        # file is written once things have been quiet for 250 ms
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._save_cfg_disk_now)
+        # Debug messages are buffered and appended to the console in batches
+        # (only the last LOG_MAX_LINES can end up in the console anyway)
+        self._log_pending = deque(maxlen=LOG_MAX_LINES)
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(LOG_FLUSH_MS)
+        self._log_timer.timeout.connect(self._flush_debug)
+        # Telemetry packets can arrive faster than the UI repaints; only the
+        # latest packet is shown when the throttle timer fires
+        self._tel_latest = None
+        # Packet currently shown, so onTel only updates labels that changed
+        self._tel_shown = None
+        self._tel_timer = QtCore.QTimer(self)
+        self._tel_timer.setSingleShot(True)
+        self._tel_timer.setInterval(TEL_UI_MS)
+        self._tel_timer.timeout.connect(self._flush_telemetry)
+        # Latest channel values computed by tick(), shown when _ch_timer fires
+        self._ch_latest = None
+        self._ch_timer = QtCore.QTimer(self)
+        self._ch_timer.setSingleShot(True)
+        self._ch_timer.setInterval(CH_UI_MS)
+        self._ch_timer.timeout.connect(self._flush_channel_ui)
 
         # CSV logging setup
         self.csv_filename = None
-        self.csv_buffer = []  # Buffer for CSV rows (max 600 lines)
+        # Rows are queued for a writer thread that owns the open CSV file
+        self._csv_queue = None
+        self._csv_worker = None
+        self._csv_error = None
+        self._csv_dropped = 0
         self.csv_last_write_time = 0.0  # Track last write time for 10Hz throttling
         self.csv_start_time = None  # Track when logging started for filename
         # Fieldnames: timestamp, channels 1-16, then link stats
         self.csv_fieldnames = ['timestamp'] + [f'CH{i+1}' for i in range(CHANNELS)] + ['1RSS', '2RSS', 'LQ', 'RSNR', 'RFMD', 'TPWR', 'TRSS', 'TLQ', 'TSNR']
+        # (row column, LinkStats index, converter) for each link stats column;
+        # values match the number shown in the label, without the unit
+        self._csv_link_stats_cols = [(col, LINK_STATS_LABELS.index(name), tpwr_to_mw if name == 'TPWR' else str)
+                                     for col, name in enumerate(self.csv_fieldnames)
+                                     if name in LINK_STATS_LABELS]
 
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -173,11 +444,15 @@ class Main(QtWidgets.QWidget):
         self.mapping_baseline = ([], [])
         self.mapping_started_at = 0.0
 
+        # Last channels handed to the serial thread and when (monotonic)
+        self._last_ch_sent = None
+        self._last_ch_send_time = 0.0
+
         # Serial thread
         self.serThread = SerialThread(self.cfg["serial_port"], DEFAULT_BAUD)
         self.thread = threading.Thread(target=self.serThread.run, daemon=True)
         self.thread.start()
-        self.serThread.telemetry.connect(self.onTel)
+        self.serThread.telemetry.connect(self._on_telemetry)
         self.serThread.debug.connect(self.onDebug)
         # Device discovery events
         self.serThread.device_discovered.connect(self._on_device_discovered)
@@ -206,7 +481,7 @@ class Main(QtWidgets.QWidget):
         channels_layout.setSpacing(5)  # Space between bordered rows
         for i in range(CHANNELS):
             row = ChannelRow(i, self.cfg["channels"][i] if i < len(self.cfg["channels"]) else DEFAULT_CFG["channels"][0])
-            row.changed.connect(self.save_cfg)
+            row.changed.connect(functools.partial(self.save_cfg, i))
             row.mapRequested.connect(self.begin_mapping)
             # Pipe row debug output into the app debug log
             # Only connect debug logging for CH2 (index 1) to reduce noise
@@ -225,6 +500,17 @@ class Main(QtWidgets.QWidget):
             self.rows.append(row)
             channels_layout.addWidget(channel_box)
 
+        # Last channel configs written by save_cfg, used to skip no-op saves
+        self._cached_channel_cfgs = [r.to_cfg() for r in self.rows]
+        # save_cfg replaces single entries in place, so give cfg its own list
+        # (it may still be the one shared with DEFAULT_CFG)
+        self.cfg["channels"] = list(self._cached_channel_cfgs)
+        self._update_ch_mapped()
+        # Bound show_value per row, resolved once for onChannels and _flush_channel_ui
+        self._row_show = [r.show_value for r in self.rows]
+        # Bound compute per row, resolved once for tick
+        self._row_compute = [r.compute for r in self.rows]
+
         ch_container = QtWidgets.QWidget()
         ch_container.setLayout(channels_layout)
 
@@ -322,10 +608,15 @@ class Main(QtWidgets.QWidget):
             v.addWidget(lab, alignment=QtCore.Qt.AlignCenter)
             tel.addWidget(box)
             self.telLabels[key] = lab
+        # (LinkStats index, label setter, formatter) per telemetry label, resolved once for onTel
+        self._tel_render = [(LINK_STATS_LABELS.index(k), lab.setText, _telemetry_formatter(k))
+                            for k, lab in self.telLabels.items()]
+        self._tel_set_style = [lab.setStyleSheet for lab in self.telLabels.values()]
 
         # Initially set link stats labels to grey
         for lab in self.telLabels.values():
-            lab.setStyleSheet("color: #888888;")
+            lab.setStyleSheet(STYLE_TEL_STALE)
+        self._tel_style = STYLE_TEL_STALE
 
         # Collapsible log section
         self.log_container = QtWidgets.QWidget()
@@ -358,6 +649,7 @@ class Main(QtWidgets.QWidget):
         self.log.setReadOnly(True)
         self.log.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
         self.log.setFixedHeight(140)
+        self.log.setMaximumBlockCount(LOG_MAX_LINES)
 
         # Restore console state from config
         self.log_expanded = self.cfg.get("console_expanded", True)
@@ -380,7 +672,7 @@ class Main(QtWidgets.QWidget):
 
         # Controller status at far left
         self.joyStatusLabel = QtWidgets.QLabel("Scanning for controller...")
-        self.joyStatusLabel.setStyleSheet("color: red; font-weight: bold;")
+        self.joyStatusLabel.setStyleSheet(STYLE_RED_BOLD)
         port_layout.addWidget(self.joyStatusLabel)
 
         # Divider between controller status and COM controls
@@ -415,7 +707,7 @@ class Main(QtWidgets.QWidget):
 
         # JR Bay status right after the port controls
         self.jrBayStatusLabel = QtWidgets.QLabel("Disconnected")
-        self.jrBayStatusLabel.setStyleSheet("color: red; font-weight: bold;")
+        self.jrBayStatusLabel.setStyleSheet(STYLE_RED_BOLD)
         port_layout.addWidget(self.jrBayStatusLabel)
 
         # Divider between JR Bay status and logging
@@ -487,10 +779,62 @@ class Main(QtWidgets.QWidget):
         self.config_loading.setVisible(False)
         # Add it to the config layout as the first widget (hidden by default)
         config_layout.addWidget(self.config_loading)
-        # Mapping of field id -> widget used for updating without a full re-populate
-        self._config_field_widgets = {}
-        # Pending writes: fid -> (desired_value, timestamp)
-        self._pending_param_writes = {}
+        # Small toolbar with a Refresh button; the scroll area holding the
+        # rows is added below it on the first populate
+        self._config_toolbar = QtWidgets.QHBoxLayout()
+        self._config_refresh_button = QtWidgets.QPushButton("Refresh")
+        self._config_refresh_button.setMaximumWidth(120)
+        self._config_refresh_button.clicked.connect(self._refresh_clicked)
+        self._config_toolbar.addWidget(self._config_refresh_button)
+        self._config_toolbar.addStretch()
+        config_layout.addLayout(self._config_toolbar)
+        # Mapping of field id -> widget used for updating without a full re-populate.
+        # Held weakly, so entries for widgets Qt has deleted drop out on their own.
+        self._config_field_widgets = weakref.WeakValueDictionary()
+        # Rows persist across populates: fid -> row widget, and fid -> signature
+        # of the field the row was built from (rows are rebuilt only when it changes)
+        self._config_field_rows = {}
+        self._config_field_signatures = {}
+        # (fid, signature) pairs of the last populate, in field order
+        self._config_structure = None
+        # Folder group boxes keyed by parent field id: parent -> (group_box, layout)
+        self._config_group_layouts = {}
+        # Scroll area holding the rows; created on the first populate
+        self._config_scroll = None
+        self._config_inner_widget = None
+        self._config_inner_layout = None
+        # Combo rows not built yet: fid -> latest field. They are built once
+        # they come near the viewport.
+        self._config_placeholders = {}
+        self._config_row_height = 30
+        self._config_realize_timer = QtCore.QTimer(self)
+        self._config_realize_timer.setSingleShot(True)
+        self._config_realize_timer.setInterval(50)
+        self._config_realize_timer.timeout.connect(self._realize_visible_config_rows)
+        self.tabs.currentChanged.connect(self._schedule_config_realize)
+        # Row builder per CRSF field type; other types get _build_unknown_row
+        self._config_row_builders = dict.fromkeys(range(9), self._build_combo_row)
+        self._config_row_builders.update({
+            9: self._build_combo_row,
+            11: self._build_info_row,
+            12: self._build_string_row,
+            13: self._build_command_row,
+        })
+        # Populates arriving in quick succession collapse into one, using the
+        # latest (fields, src)
+        self._pending_populate = None
+        self._populate_timer = QtCore.QTimer(self)
+        self._populate_timer.setSingleShot(True)
+        self._populate_timer.setInterval(50)
+        self._populate_timer.timeout.connect(self._do_populate_config_tab)
+        # Pending writes: fid -> (desired_value, timestamp), oldest first
+        self._pending_param_writes = OrderedDict()
+        # Field updates arriving in a burst are applied together: fid -> latest field
+        self._pending_field_updates = {}
+        self._field_update_timer = QtCore.QTimer(self)
+        self._field_update_timer.setSingleShot(True)
+        self._field_update_timer.setInterval(16)
+        self._field_update_timer.timeout.connect(self._flush_field_updates)
 
         # Set Channels as default and disable Configuration tab until module detected
         self.tabs.setCurrentIndex(0)
@@ -511,6 +855,11 @@ class Main(QtWidgets.QWidget):
         self.timer = QtCore.QTimer(self)
         self.timer.timeout.connect(self.tick)
         self.timer.start(int(1000 / SEND_HZ))
+        # Heartbeat/timeout checks and style updates don't need the send rate;
+        # mapping timeout is checked within 100 ms, which is plenty for a human
+        self.ui_timer = QtCore.QTimer(self)
+        self.ui_timer.timeout.connect(self._ui_tick)
+        self.ui_timer.start(UI_TICK_MS)
 
         # Schedule initial connection attempt after GUI is shown
         def attempt_initial_connection():
@@ -528,32 +877,28 @@ class Main(QtWidgets.QWidget):
         """Update module status in tab title"""
         self.tabs.setTabText(1, self._module_status)
 
-    def onTel(self, d):
-        for k, v in d.items():
-            if k in self.telLabels:
-                try:
-                    # Special handling for TPWR - convert to mW value
-                    if k == 'TPWR' and v is not None:
-                        mw_value = tpwr_to_mw(v)
-                        unit = TELEMETRY_UNIT_MAP.get(k)
-                        if unit:
-                            text = f"{mw_value} {unit}"
-                        else:
-                            text = mw_value
-                    else:
-                        unit = TELEMETRY_UNIT_MAP.get(k)
-                        if unit and v is not None:
-                            # display numeric values with units
-                            if isinstance(v, float):
-                                text = f"{v:.1f} {unit}"
-                            else:
-                                text = f"{v} {unit}"
-                        else:
-                            text = str(v)
-                except Exception:
-                    text = str(v)
-                self.telLabels[k].setText(text)
-
+    def _on_telemetry(self, stats):
+        """Keep the newest telemetry packet and schedule a throttled UI update"""
+        self._tel_latest = stats
+        if not self._tel_timer.isActive():
+            self._tel_timer.start()
+
+    def _flush_telemetry(self):
+        stats = self._tel_latest
+        if stats is not None:
+            self._tel_latest = None
+            self.onTel(stats)
+
+    def onTel(self, stats):
+        """Show a LinkStats packet in the telemetry labels"""
+        prev = self._tel_shown
+        if stats == prev:
+            return
+        self._tel_shown = stats
+        for i, set_text, fmt in self._tel_render:
+            v = stats[i]
+            if prev is None or v != prev[i]:
+                set_text(fmt(v))
 
     def onConnectionStatus(self, is_connected):
         """Update status indicator based on actual connection state"""
@@ -561,14 +906,14 @@ class Main(QtWidgets.QWidget):
             # Serial port connected
             try:
                 self.jrBayStatusLabel.setText("Connected")
-                self.jrBayStatusLabel.setStyleSheet("color: white; font-weight: bold;")
+                self.jrBayStatusLabel.setStyleSheet(STYLE_WHITE_BOLD)
             except Exception:
                 pass
         else:
             # Serial port disconnected
             try:
                 self.jrBayStatusLabel.setText("Disconnected")
-                self.jrBayStatusLabel.setStyleSheet("color: red; font-weight: bold;")
+                self.jrBayStatusLabel.setStyleSheet(STYLE_RED_BOLD)
             except Exception:
                 pass
             # When the serial port disconnects the TX is implicitly unreachable
@@ -581,8 +926,19 @@ class Main(QtWidgets.QWidget):
                 pass
 
     def onDebug(self, s):
+        self._log_pending.append(s)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+
+    def _flush_debug(self):
+        """Append all buffered debug messages to the console in one call"""
+        pending = self._log_pending
+        if not pending:
+            return
+        text = '\n'.join(pending)
+        pending.clear()
         try:
-            self.log.appendPlainText(s)
+            self.log.appendPlainText(text)
         except Exception:
             pass
 
@@ -593,20 +949,20 @@ class Main(QtWidgets.QWidget):
             # Set color based on status
             status_lower = str(s).lower()
             if "scanning" in status_lower or "no joystick" in status_lower or "disconnected" in status_lower:
-                self.joyStatusLabel.setStyleSheet("color: red; font-weight: bold;")
+                self.joyStatusLabel.setStyleSheet(STYLE_RED_BOLD)
             else:
                 # Connected - show joystick name in white
-                self.joyStatusLabel.setStyleSheet("color: white; font-weight: bold;")
+                self.joyStatusLabel.setStyleSheet(STYLE_WHITE_BOLD)
         except Exception:
             pass
 
     def onChannels(self, chans):
         """Update GUI channel displays when CRSF RC_CHANNELS frames arrive."""
         try:
-            for i, v in enumerate(chans):
-                if i < len(self.rows):
-                    self.rows[i].bar.setValue(v)
-                    self.rows[i].val.setText(str(v))
+            # zip stops at whichever is shorter, frame or rows; rows skip
+            # values they already show
+            for v, show in zip(chans, self._row_show):
+                show(v)
         except Exception as e:
             self.onDebug(f"onChannels error: {e}")
 
@@ -620,7 +976,7 @@ class Main(QtWidgets.QWidget):
             # GUI updates and TX heartbeat update
             # Record heartbeat time for this TX source
             try:
-                self._last_tx_heartbeat = time.time()
+                self._last_tx_heartbeat = time.monotonic()
                 # mark TX connected and update module status
                 if not self._tx_connected:
                     self._tx_connected = True
@@ -644,6 +1000,10 @@ class Main(QtWidgets.QWidget):
             self.onDebug(f"onSync error: {e}")
 
     def tick(self):
+        """Read the joystick, compute channels and hand them to the serial thread.
+
+        Runs at SEND_HZ; slower housekeeping lives in _ui_tick.
+        """
         axes, btns = self.joy.read()
         joystick_connected = self.joy.j is not None
 
@@ -653,19 +1013,15 @@ class Main(QtWidgets.QWidget):
             detected = None
             # Button press has priority
             if btns and base_btns:
-                for i in range(min(len(btns), len(base_btns))):
-                    if base_btns[i] == 0 and btns[i] == 1:
-                        detected = ("button", i)
-                        break
+                i = next((i for i, (b, pb) in enumerate(zip(btns, base_btns)) if pb == 0 and b == 1), None)
+                if i is not None:
+                    detected = ("button", i)
             # Axis movement if no button detected
             if detected is None and axes and base_axes:
-                best_i, best_d = -1, 0.0
-                for i in range(min(len(axes), len(base_axes))):
-                    d = abs(axes[i] - base_axes[i])
-                    if d > best_d:
-                        best_d, best_i = d, i
-                if best_i >= 0 and best_d > 0.35:
-                    detected = ("axis", best_i)
+                deltas = [abs(a - pa) for a, pa in zip(axes, base_axes)]
+                best_d = max(deltas)
+                if best_d > 0.35:
+                    detected = ("axis", deltas.index(best_d))
 
             if detected is not None:
                 src, idx = detected
@@ -678,26 +1034,49 @@ class Main(QtWidgets.QWidget):
                 self.onDebug(f"Mapped CH{self.mapping_row.idx+1} to {src}[{idx}]")
                 self.mapping_row = None
                 self.save_cfg()
-            elif time.time() - self.mapping_started_at > 5.0:
-                # Timeout after 5 seconds
-                try:
-                    self.mapping_row.mapBtn.setText("Map")
-                    self.mapping_row.mapBtn.setEnabled(True)
-                except Exception:
-                    pass
-                self.onDebug("Mapping timed out; try again.")
-                self.mapping_row = None
 
-        ch = [r.compute(axes, btns) for r in self.rows]
+        ch = [compute(axes, btns) for compute in self._row_compute]
 
         # Enforce toggle groups: only one toggle per group can be on
         ch = self._enforce_toggle_groups(ch)
 
+        # Bars and visualizers are repainted by _flush_channel_ui at CH_UI_MS
+        self._ch_latest = ch
+        if not self._ch_timer.isActive():
+            self._ch_timer.start()
+
+        # Update the shared channel buffer (decoupled); avoid transmitting when joystick disconnected
+        # Unchanged channels are re-sent every CH_KEEPALIVE_S so the serial thread
+        # keeps seeing joystick activity
+        if joystick_connected:
+            now = time.monotonic()
+            if ch != self._last_ch_sent or now - self._last_ch_send_time > CH_KEEPALIVE_S:
+                try:
+                    self.serThread.send_channels(ch)
+                    self._last_ch_sent = ch
+                    self._last_ch_send_time = now
+                except Exception:
+                    pass
+
+        # CSV logging at 10Hz (if enabled)
+        if self.logging_enabled.isChecked():
+            now = time.monotonic()
+            if now - self.csv_last_write_time >= 0.1:  # 10Hz = 100ms
+                self._log_to_csv(ch)
+                self.csv_last_write_time = now
+
+    def _flush_channel_ui(self):
+        """Show the latest computed channels in the rows, stick visualizers and bars"""
+        ch = self._ch_latest
+        if ch is None:
+            return
+        self._ch_latest = None
+
         # Update joystick visualizers (CH1-4)
         try:
             if len(ch) >= 4:
-                # Check which channels are mapped (not "none") from saved config
-                ch_mapped = [self.cfg["channels"][i].get("src", "none") != "none" for i in range(4)]
+                # Which channels are mapped (not "none"), kept up to date by save_cfg
+                ch_mapped = self._ch_mapped
 
                 if self.current_mode == "Mode 1":
                     # Mode 1: Left stick = CH4 horiz, CH2 vert; Right stick = CH1 horiz, CH3 vert
@@ -710,25 +1089,37 @@ class Main(QtWidgets.QWidget):
         except Exception:
             pass
 
+        # Update each channel row's bar and value label
+        try:
+            for show, v in zip(self._row_show, ch):
+                show(v)
+        except Exception:
+            pass
+
         # Update progress bars for channels 1-16
         try:
-            # Update all channel bars in real-time
-            for i, bar in enumerate(self.all_channel_bars):
-                if i < len(ch):
-                    bar.setValue(ch[i])
+            for bar, v in zip(self.all_channel_bars, ch):
+                bar.setValue(v)
         except Exception:
             pass
 
-        # Update the shared channel buffer (decoupled); avoid transmitting when joystick disconnected
-        if joystick_connected:
+    def _ui_tick(self):
+        """Slow UI housekeeping: mapping timeout, TX heartbeat and link stats staleness"""
+        now = time.monotonic()
+
+        # Mapping mode times out after 5 seconds without input
+        if self.mapping_row is not None and now - self.mapping_started_at > 5.0:
             try:
-                self.serThread.send_channels(ch)
+                self.mapping_row.mapBtn.setText("Map")
+                self.mapping_row.mapBtn.setEnabled(True)
             except Exception:
                 pass
+            self.onDebug("Mapping timed out; try again.")
+            self.mapping_row = None
 
         # TX heartbeat timeout: if we haven't seen a sync (handset timing) for >2s, mark TX disconnected
         try:
-            if self._tx_connected and (time.time() - self._last_tx_heartbeat) > 2.0:
+            if self._tx_connected and (now - self._last_tx_heartbeat) > 2.0:
                 self._tx_connected = False
                 try:
                     self._module_status = "No module detected"
@@ -738,95 +1129,118 @@ class Main(QtWidgets.QWidget):
                 except Exception:
                     pass
                 # Reset discovery state for the TX so that a fresh device ping occurs
-                nowt = time.time()
-                if nowt - self._last_tx_reset_time > 1.0:
+                if now - self._last_tx_reset_time > 1.0:
                     try:
                         self.serThread.reset_tx_disconnected()
                     except Exception as e:
                         self.onDebug(f"Error resetting TX discovery: {e}")
-                    self._last_tx_reset_time = nowt
+                    self._last_tx_reset_time = now
         except Exception as e:
             self.onDebug(f"TX heartbeat check failed: {e}")
 
-        # CSV logging at 10Hz (if enabled)
-        now = time.time()
-        if self.logging_enabled.isChecked() and (now - self.csv_last_write_time) >= 0.1:  # 10Hz = 100ms
-            self._log_to_csv(ch)
-            self.csv_last_write_time = now
-
         # Link stats timeout check
         timeout = now - self.serThread.last_link_stats_time > 5.0
-        color = "#888888" if timeout else "#e0e0e0"
-        for lab in self.telLabels.values():
-            lab.setStyleSheet(f"color: {color};")
+        style = STYLE_TEL_STALE if timeout else STYLE_TEL_LIVE
+        # Only restyle when the labels flip between stale and live
+        if style != self._tel_style:
+            for set_style in self._tel_set_style:
+                set_style(style)
+            self._tel_style = style
+
+    def save_cfg(self, idx=None):
+        """Store the channel configs in self.cfg and schedule a write to disk.
 
-    def save_cfg(self):
-        self.cfg["channels"] = [r.to_cfg() for r in self.rows]
+        Args:
+            idx: Index of the row that changed, or None to re-read every row
+        """
+        # Rows emit `changed` for edits that end up where they started (e.g. slider drags)
+        if idx is not None:
+            new_row = self.rows[idx].to_cfg()
+            if new_row == self._cached_channel_cfgs[idx]:
+                return
+            self._cached_channel_cfgs[idx] = new_row
+            self.cfg["channels"][idx] = new_row
+        else:
+            new = [r.to_cfg() for r in self.rows]
+            if new == self._cached_channel_cfgs:
+                return
+            self._cached_channel_cfgs = new
+            self.cfg["channels"] = list(new)
+        self._update_ch_mapped()
         self._save_cfg_disk()
         self.onDebug("Config saved")
 
+    def _update_ch_mapped(self):
+        """Recompute which channels have a source, from the saved channel configs"""
+        self._ch_mapped = [c.get("src", "none") != "none" for c in self._cached_channel_cfgs]
+
     def _enforce_toggle_groups(self, ch):
         ch = list(ch)  # Make a copy to avoid modifying the original
 
-        # Build a map of group ID to list of (channel_idx, row) tuples
-        groups = {}
+        # Most recently activated toggle that is on, per group: group_id -> (time, channel_idx)
+        newest = {}
         for i, row in enumerate(self.rows):
-            if row.toggleBox.isChecked():
-                # Convert dropdown index to group ID: 0 = None (-1), 1-8 = Groups 1-8 (0-7)
-                dropdown_index = row.toggleGroupBox.currentIndex()
-                if dropdown_index == 0:
-                    # Skip toggles with group "None" - they are independent
-                    continue
-                group_id = dropdown_index - 1  # Convert to 0-7 for Groups 1-8
-                if group_id not in groups:
-                    groups[group_id] = []
-                groups[group_id].append((i, row))
-
-        # For each group, ensure only one toggle is on at a time
-        for group_id, members in groups.items():
-            # Find all toggles that are currently on and which was most recently activated
-            on_toggles = []
-            for idx, row in members:
-                if row._btn_toggle_state == 1:
-                    on_toggles.append((row._toggle_activated_time, idx, row))
-
-            # If multiple toggles are on, keep only the most recently activated one
-            if len(on_toggles) > 1:
-                # Sort by activation time (most recent last)
-                on_toggles.sort(key=lambda x: x[0])
-                # Turn off all but the most recently activated one
-                for _, idx, row in on_toggles[:-1]:
-                    row._btn_toggle_state = 0
-                    ch[idx] = row.minBox.value()
+            if row._btn_toggle_state != 1 or not row.toggleBox.isChecked():
+                continue
+            # Dropdown index 0 = None (independent toggle), 1-8 = Groups 1-8
+            group_id = row.toggleGroupBox.currentIndex() - 1
+            if group_id < 0:
+                continue
+            t = row._toggle_activated_time
+            # Ties go to the later channel
+            if group_id not in newest or t >= newest[group_id][0]:
+                newest[group_id] = (t, i)
+
+        if not newest:
+            return ch
+
+        # Turn off every other toggle that is on in the same group
+        for i, row in enumerate(self.rows):
+            if row._btn_toggle_state != 1 or not row.toggleBox.isChecked():
+                continue
+            group_id = row.toggleGroupBox.currentIndex() - 1
+            if group_id >= 0 and newest[group_id][1] != i:
+                row._btn_toggle_state = 0
+                ch[i] = row.minBox.value()
 
         return ch
 
     def _save_cfg_disk(self):
+        """Schedule a write of the config to disk (see _save_timer)."""
+        self._save_timer.start()
+
+    def _save_cfg_disk_now(self):
+        """Write the config to disk, replacing calib.json atomically."""
+        self._save_timer.stop()
+        tmp_name = None
         try:
-            with open("calib.json", "w") as f:
-                json.dump(self.cfg, f, indent=2)
+            cfg_dir = os.path.dirname(os.path.abspath("calib.json"))
+            if orjson is not None:
+                data = orjson.dumps(self.cfg, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(self.cfg, indent=2).encode("utf-8")
+            with tempfile.NamedTemporaryFile("wb", dir=cfg_dir, suffix=".tmp", delete=False) as f:
+                tmp_name = f.name
+                f.write(data)
+            os.replace(tmp_name, "calib.json")
         except Exception as e:
             self.onDebug(f"Save error: {e}")
+            if tmp_name and os.path.exists(tmp_name):
+                try:
+                    os.remove(tmp_name)
+                except Exception:
+                    pass
 
     def _get_icon_path(self):
-        """Get the path to icon.ico, handling both PyInstaller bundle and normal execution"""
-        try:
-            # PyInstaller creates a temp folder and stores path in _MEIPASS
-            base_path = sys._MEIPASS
-        except AttributeError:
-            # Not running as PyInstaller bundle, use script directory
-            base_path = os.path.dirname(os.path.abspath(__file__))
-
-        return os.path.join(base_path, 'icon.ico')
+        """Get the path to icon.ico (resolved once at import time)"""
+        return ICON_PATH
 
     def _set_dark_title_bar(self):
         """Set dark title bar on Windows 10/11"""
         try:
-            import platform
-            if platform.system() == "Windows":
+            if IS_WINDOWS:
                 # For Windows 10/11, use DWM API to enable dark title bar
                 try:
-                    from ctypes import windll, c_int, byref, sizeof
                     HWND = int(self.winId())
                     # DWMWA_USE_IMMERSIVE_DARK_MODE = 20 (Windows 11) or 19 (Windows 10 older builds)
                     DWMWA_USE_IMMERSIVE_DARK_MODE = 20
@@ -845,8 +1259,9 @@ class Main(QtWidgets.QWidget):
 
     def _load_cfg(self):
         try:
-            with open("calib.json", "r") as f:
-                disk = json.load(f)
+            with open("calib.json", "rb") as f:
+                raw = f.read()
+            disk = orjson.loads(raw) if orjson is not None else json.loads(raw)
             self.cfg.update(disk)
             chs = self.cfg.get("channels", [])
             if len(chs) < CHANNELS:
@@ -857,28 +1272,27 @@ class Main(QtWidgets.QWidget):
 
     def _refresh_port_list(self):
         """Refresh the list of available COM ports"""
-        current = self.portCombo.currentText()
-        self.portCombo.blockSignals(True)
-        self.portCombo.clear()
-        ports = get_available_ports()
-        for port, desc in ports:
-            # Display port with device name, but store port number as data
-            if desc:
-                display_text = f"{port} - {desc}"
-            else:
-                display_text = port
-            self.portCombo.addItem(display_text, port)
-        # If the previous selection still exists, restore it
-        if current:
-            for i in range(self.portCombo.count()):
-                if self.portCombo.itemData(i) == current:
+        # Items show "port - description"; the port itself is the item data
+        current = self.portCombo.currentData()
+        with QSignalBlocker(self.portCombo):
+            self.portCombo.clear()
+            ports = get_available_ports()
+            for port, desc in ports:
+                # Display port with device name, but store port number as data
+                if desc:
+                    display_text = f"{port} - {desc}"
+                else:
+                    display_text = port
+                self.portCombo.addItem(display_text, port)
+            # If the previous selection still exists, restore it
+            if current:
+                i = self.portCombo.findData(current)
+                if i >= 0:
                     self.portCombo.setCurrentIndex(i)
-                    self.portCombo.blockSignals(False)
                     return
-        # Otherwise select the first available port
-        if ports:
-            self.portCombo.setCurrentIndex(0)
-        self.portCombo.blockSignals(False)
+            # Otherwise select the first available port
+            if ports:
+                self.portCombo.setCurrentIndex(0)
 
     def _on_display_mode_changed(self, mode):
         """Handle display mode change between Mode 1, Mode 2, and Channels"""
@@ -941,7 +1355,7 @@ class Main(QtWidgets.QWidget):
             port = port_display  # Fallback if data not set
         self.cfg["serial_port"] = port
         self.serThread.reconnect(port, DEFAULT_BAUD)
-        self.save_cfg()
+        self._save_cfg_disk()
 
 
     # Packet rate moved into the Configuration tab as a standard 'select' field.
@@ -951,7 +1365,7 @@ class Main(QtWidgets.QWidget):
         """Handle parameter change from config tab"""
         if hasattr(self, 'current_device_id'):
             device_id = self.current_device_id
-            payload = bytes([device_id, CRSF_ADDRESS_ELRS_LUA, int(fid) & 0xFF, int(value) & 0xFF])
+            payload = bytes([device_id, CRSF_ADDRESS_ELRS_LUA, fid & 0xFF, int(value) & 0xFF])
             try:
                 msg = f"Param cmd: send parameter write payload: {payload.hex()} (dev={device_id}, fid={fid}, value={value})"
                 self.onDebug(msg)
@@ -964,10 +1378,10 @@ class Main(QtWidgets.QWidget):
                 pass
             self.serThread._send_crsf_cmd(CRSF_FRAMETYPE_PARAMETER_WRITE, payload)
             # Track pending write so a later device read doesn't override the UI
-            try:
-                self._pending_param_writes[int(fid)] = (value, time.time())
-            except Exception:
-                pass
+            pending_writes = self._pending_param_writes
+            pending_writes[fid] = (value, time.monotonic())
+            # Keep the dict ordered by timestamp so stale entries sit at the head
+            pending_writes.move_to_end(fid)
             # If RF Band changed, request a refresh of Packet Rate (sibling) so values/options update
             try:
                 dev = self.serThread.elrs_devices.get(device_id, {})
@@ -1009,7 +1423,7 @@ class Main(QtWidgets.QWidget):
             self._setup_csv_logging()
         else:
             # Stop logging - flush buffer and close
-            self._flush_csv_buffer()
+            self._close_csv_log()
             if self.csv_filename:
                 self.onDebug(f"CSV logging stopped: {self.csv_filename}")
                 self.csv_filename = None
@@ -1020,9 +1434,12 @@ class Main(QtWidgets.QWidget):
             self.serThread.close()
         except:
             pass
+        # Write out a config save that is still waiting on the timer
+        if self._save_timer.isActive():
+            self._save_cfg_disk_now()
         # Flush and close CSV logging
         try:
-            self._flush_csv_buffer()
+            self._close_csv_log()
             if hasattr(self, 'csv_filename') and self.csv_filename:
                 self.onDebug(f"CSV logging stopped: {self.csv_filename}")
         except:
@@ -1040,7 +1457,7 @@ class Main(QtWidgets.QWidget):
                 pass
         self.mapping_row = row
         self.mapping_baseline = self.joy.read()
-        self.mapping_started_at = time.time()
+        self.mapping_started_at = time.monotonic()
         try:
             row.mapBtn.setText("...")
             row.mapBtn.setEnabled(False)
@@ -1066,77 +1483,112 @@ class Main(QtWidgets.QWidget):
             timestamp = self.csv_start_time.strftime("%Y%m%d_%H%M%S") if self.csv_start_time else datetime.now().strftime("%Y%m%d_%H%M%S")
             self.csv_filename = os.path.join(logs_dir, f"data_log_{timestamp}.csv")
 
-            # Create CSV file and write header
-            with open(self.csv_filename, 'w', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.csv_fieldnames)
-                writer.writeheader()
-
-            # Clear buffer
-            self.csv_buffer = []
+            # Create CSV file and write header. The file stays open while logging;
+            # the writer thread writes queued rows to it in batches.
+            csvfile = open(self.csv_filename, 'w', newline='', buffering=65536)
+            csv.writer(csvfile).writerow(self.csv_fieldnames)
+
+            self._csv_error = None
+            self._csv_dropped = 0
+            self._csv_queue = queue.Queue(CSV_QUEUE_MAX)
+            self._csv_worker = threading.Thread(target=self._csv_writer_loop,
+                                                args=(csvfile, self._csv_queue), daemon=True)
+            self._csv_worker.start()
             self.onDebug(f"CSV logging started: {self.csv_filename}")
         except Exception as e:
             self.onDebug(f"CSV logging setup error: {e}")
             self.csv_filename = None
 
     def _log_to_csv(self, channel_values):
-        """Add data to CSV buffer (link stats + channels), flush when buffer reaches 600 lines"""
-        if self.csv_filename is None:
+        """Queue a CSV row (link stats + channels) for the writer thread"""
+        if self._csv_queue is None:
             return
 
         try:
-            # Create row with timestamp
-            row = {'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]}
-
-            # Add link stats (get latest from telemetry labels)
-            link_stats_fields = ['1RSS', '2RSS', 'LQ', 'RSNR', 'RFMD', 'TPWR', 'TRSS', 'TLQ', 'TSNR']
-            for field in link_stats_fields:
-                try:
-                    text = self.telLabels.get(field, QtWidgets.QLabel("--")).text()
-                    # Extract numeric value (remove units)
-                    if text and text != "--":
-                        row[field] = text.split()[0]  # Get first token (the number)
-                    else:
-                        row[field] = ''
-                except Exception:
-                    row[field] = ''
+            # Row in csv_fieldnames order: timestamp, channels, link stats.
+            # Slots left '' are unmapped channels or link stats not yet received.
+            row = [''] * len(self.csv_fieldnames)
+            # Wall-clock time; the writer thread formats it
+            row[0] = time.time()
 
             # Add channel values (only for mapped channels)
-            for i in range(CHANNELS):
-                if i < len(channel_values):
-                    # Check if channel is mapped
-                    src = self.rows[i].src.currentText() if i < len(self.rows) else "none"
-                    if src != "none":
-                        row[f'CH{i+1}'] = channel_values[i]
-                    else:
-                        row[f'CH{i+1}'] = ''
-                else:
-                    row[f'CH{i+1}'] = ''
+            for col, (v, mapped) in enumerate(zip(channel_values[:CHANNELS], self._ch_mapped), 1):
+                if mapped:
+                    row[col] = v
 
-            # Add to buffer
-            self.csv_buffer.append(row)
+            # Add link stats from the packet shown in the telemetry labels
+            stats = self._tel_shown
+            if stats is not None:
+                for col, i, conv in self._csv_link_stats_cols:
+                    row[col] = conv(stats[i])
 
-            # Flush if buffer reaches 600 lines
-            if len(self.csv_buffer) >= 600:
-                self._flush_csv_buffer()
+            self._csv_queue.put_nowait(row)
 
+        except queue.Full:
+            self._csv_dropped += 1
         except Exception as e:
             # Avoid spamming the log with CSV errors
             pass
 
-    def _flush_csv_buffer(self):
-        """Write buffered CSV data to file"""
-        if not self.csv_buffer or self.csv_filename is None:
-            return
+    def _csv_writer_loop(self, csvfile, rows):
+        """Write queued CSV rows to the log file (runs on the CSV writer thread).
 
+        Rows arriving within CSV_WRITE_PERIOD of each other are written with a
+        single writerows() call. A None row ends the loop and closes the file.
+        The timestamp in each row's first column is formatted here.
+        """
+        writer = csv.writer(csvfile)
+        # "YYYY-MM-DD HH:MM:SS" only changes once a second, so it is reused
+        # until the whole second changes and just the milliseconds are added
+        ts_sec = None
+        ts_prefix = ''
         try:
-            with open(self.csv_filename, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=self.csv_fieldnames)
-                writer.writerows(self.csv_buffer)
-            self.csv_buffer = []
+            row = rows.get()
+            while row is not None:
+                batch = []
+                deadline = time.monotonic() + CSV_WRITE_PERIOD
+                while row is not None:
+                    batch.append(row)
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        row = rows.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                for r in batch:
+                    t = r[0]
+                    sec = int(t)
+                    if sec != ts_sec:
+                        ts_sec = sec
+                        ts_prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+                    r[0] = f"{ts_prefix}.{int((t - sec) * 1000):03d}"
+                writer.writerows(batch)
+                if row is not None:
+                    row = rows.get()
         except Exception as e:
-            self.onDebug(f"CSV flush error: {e}")
-
-
+            # Widgets can't be touched from this thread; reported when logging stops
+            self._csv_error = e
+        finally:
+            csvfile.close()
+
+    def _close_csv_log(self):
+        """Stop the CSV writer thread once it has written every queued row"""
+        if self._csv_queue is None:
+            return
+        try:
+            self._csv_queue.put(None, timeout=2.0)
+        except queue.Full:
+            pass
+        self._csv_worker.join(timeout=2.0)
+        self._csv_queue = None
+        self._csv_worker = None
+        if self._csv_error is not None:
+            self.onDebug(f"CSV write error: {self._csv_error}")
+            self._csv_error = None
+        if self._csv_dropped:
+            self.onDebug(f"CSV writer fell behind, {self._csv_dropped} rows dropped")
+            self._csv_dropped = 0
 
     def _on_device_discovered(self, src: int, details: dict):
         # Update the UI state when a device is discovered: show device name and mark current device
@@ -1166,56 +1618,28 @@ class Main(QtWidgets.QWidget):
             pass
 
     def _on_device_parameters_loaded(self, src: int, details: dict):
-        # Populate packet rate dropdown when parameters are loaded
+        # The Packet Rate select is built by _populate_config_tab like any other field
         fields = details.get('fields', {})
-        for fid, field in fields.items():
-            # Packet Rate combo moved into the configuration tab UI; the config tab will populate it
-            # The _populate_config_tab function will create a QComboBox for this field like any other select.
-            pass
 
         # Only populate config tab after the serial thread indicates the device is fully loaded
         loaded = details.get('loaded', False)
         if not loaded:
             # keep spinner visible, but don't re-populate the config tab until fully loaded
-            try:
-                self.config_loading.setVisible(True)
-            except Exception:
-                pass
+            self.config_loading.setVisible(True)
             return
 
         # Hide loading indicator and populate the UI once full parameters are available
-        try:
-            self.config_loading.setVisible(False)
-            try:
-                if hasattr(self, '_config_refresh_button'):
-                    self._config_refresh_button.setEnabled(True)
-            except Exception:
-                pass
-        except Exception:
-            pass
+        self.config_loading.setVisible(False)
+        self._config_refresh_button.setEnabled(True)
 
         # Populate config tab with all parameters (full reload only after device loaded)
         self._populate_config_tab(fields, src)
-        # Clear pending writes that are now reflected by the device
-        try:
-            # Walk pending writes list and remove if device now reports same value
-            dev = self.serThread.elrs_devices.get(src, {})
-            dev_fields = dev.get('fields', {})
-            to_clear = []
-            for pfid, (pval, ts) in list(self._pending_param_writes.items()):
-                fld = dev_fields.get(int(pfid))
-                if fld is None:
-                    continue
-                dev_val = fld.get('value', fld.get('status', None))
-                if dev_val == pval:
-                    to_clear.append(int(pfid))
-            for pfid in to_clear:
-                try:
-                    del self._pending_param_writes[int(pfid)]
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        # Expire stale pending writes. Writes the device has confirmed are cleared
+        # as their fields arrive in _apply_field_update.
+        pending = self._pending_param_writes
+        now = time.monotonic()
+        while pending and now - next(iter(pending.values()))[1] > 5.0:
+            pending.popitem(last=False)
 
     def _on_device_parameters_progress(self, src: int, fetched: int, total: int):
         try:
@@ -1234,243 +1658,163 @@ class Main(QtWidgets.QWidget):
             self.onDebug(f"_on_device_parameters_progress error: {e}")
 
     def _on_device_parameter_field_updated(self, src: int, fid: int, field: dict):
+        """Queue a field the device returned; updates within 16 ms are applied together."""
+        self._pending_field_updates[fid] = field
+        if not self._field_update_timer.isActive():
+            self._field_update_timer.start()
+
+    def _flush_field_updates(self):
+        """Apply all queued field updates with painting held off."""
+        updates = self._pending_field_updates
+        if not updates:
+            return
+        self._pending_field_updates = {}
+        config_tab = self.tabs.widget(1)
+        config_tab.setUpdatesEnabled(False)
+        try:
+            for fid, field in updates.items():
+                self._apply_field_update(fid, field)
+        finally:
+            config_tab.setUpdatesEnabled(True)
+
+    def _apply_field_update(self, fid, field):
         """Update the specific widget for a field when the device returns its value.
         Honors pending writes and does not overwrite user's selection while pending.
         """
         try:
-            widget = self._config_field_widgets.get(int(fid))
+            widget = self._config_field_widgets.get(fid)
             if widget is None:
+                if fid in self._config_placeholders:
+                    # Row not built yet; build it from this field when it scrolls into view
+                    self._config_placeholders[fid] = field
                 return
+            dev_value = field.get('value', field.get('status', None))
             # Check for pending write
-            pending = self._pending_param_writes.get(int(fid))
+            pending_writes = self._pending_param_writes
+            pending = pending_writes.get(fid)
             if pending:
                 desired, ts = pending
-                dev_value = field.get('value', field.get('status', None))
-                if dev_value == desired:
-                    try:
-                        if isinstance(widget, QtWidgets.QComboBox):
-                            ftype = field.get('type', -1)
-                            widget.blockSignals(True)
-                            # For numeric types (0-8), dev_value is the actual value, need to find index
-                            if 0 <= ftype <= 8:
-                                # Search combo items to find matching value
-                                target_idx = 0
-                                for i in range(widget.count()):
-                                    item_text = widget.itemText(i)
-                                    # Extract numeric value from text (strip unit if present)
-                                    try:
-                                        numeric_part = ''.join(c for c in item_text if c.isdigit() or c == '-')
-                                        if numeric_part and int(numeric_part) == int(dev_value):
-                                            target_idx = i
-                                            break
-                                    except Exception:
-                                        pass
-                                widget.setCurrentIndex(target_idx)
-                            else:
-                                # For selection type (9), dev_value is the index
-                                widget.setCurrentIndex(int(dev_value))
-                            widget.blockSignals(False)
-                        elif isinstance(widget, QtWidgets.QSpinBox):
-                            try:
-                                widget.blockSignals(True)
-                                widget.setValue(int(dev_value))
-                                widget.blockSignals(False)
-                            except Exception:
-                                widget.setValue(int(dev_value))
-                        elif isinstance(widget, QtWidgets.QLabel) or isinstance(widget, QtWidgets.QPushButton):
-                            text_val = field.get('info', field.get('value', ''))
-                            widget.setText(str(text_val))
-                    except Exception:
-                        pass
-                    try:
-                        del self._pending_param_writes[int(fid)]
-                    except Exception:
-                        pass
-                else:
-                    if time.time() - ts > 5.0:
-                        try:
-                            del self._pending_param_writes[int(fid)]
-                        except Exception:
-                            pass
+                if dev_value != desired:
+                    # Not applied yet: keep showing the user's choice
+                    if time.monotonic() - ts > 5.0:
+                        pending_writes.pop(fid, None)
                     return
-            else:
-                dev_value = field.get('value', field.get('status', None))
-                try:
-                    if isinstance(widget, QtWidgets.QComboBox) and dev_value is not None:
-                        ftype = field.get('type', -1)
-                        widget.blockSignals(True)
-                        # For numeric types (0-8), dev_value is the actual value, need to find index
-                        if 0 <= ftype <= 8:
-                            # Search combo items to find matching value
-                            target_idx = 0
-                            for i in range(widget.count()):
-                                item_text = widget.itemText(i)
-                                # Extract numeric value from text (strip unit if present)
-                                try:
-                                    numeric_part = ''.join(c for c in item_text if c.isdigit() or c == '-')
-                                    if numeric_part and int(numeric_part) == int(dev_value):
-                                        target_idx = i
-                                        break
-                                except Exception:
-                                    pass
-                            widget.setCurrentIndex(target_idx)
-                        else:
-                            # For selection type (9), dev_value is the index
-                            widget.setCurrentIndex(int(dev_value))
-                        widget.blockSignals(False)
-                    elif isinstance(widget, QtWidgets.QSpinBox) and dev_value is not None:
-                        try:
-                            widget.blockSignals(True)
-                            widget.setValue(int(dev_value))
-                            widget.blockSignals(False)
-                        except Exception:
-                            widget.setValue(int(dev_value))
-                    elif isinstance(widget, QtWidgets.QLabel) or isinstance(widget, QtWidgets.QPushButton):
-                        text_val = field.get('info', field.get('value', ''))
-                        widget.setText(str(text_val))
-                except Exception:
-                    pass
+                # Device confirmed the write
+                del pending_writes[fid]
+            widget._apply_device_value(dev_value, field)
         except Exception as e:
-            self.onDebug(f"_on_device_parameter_field_updated error: {e}")
+            self.onDebug(f"_apply_field_update error: {e}")
 
-    def _populate_config_tab(self, fields, src):
-        # Clear existing widgets in config tab
-        config_tab = self.tabs.widget(1)  # Configuration tab
-        if config_tab.layout():
-            layout = config_tab.layout()
-            # Clear all widgets from the existing layout
-            # some widgets in the config tab are permanent (like the loading bar)
-            # We'll skip deleting them here and re-insert afterwards
-            keep_loading_widget = None
-            while layout.count():
-                child = layout.takeAt(0)
-                if child.widget():
-                    w = child.widget()
-                    try:
-                        # Don't delete the global config_loading widget; keep it and re-add later
-                        if hasattr(self, 'config_loading') and w is self.config_loading:
-                            # Remove from layout now but save to re-add
-                            w.setParent(None)
-                            keep_loading_widget = w
-                        else:
-                            w.setParent(None)
-                            w.deleteLater()
-                    except Exception:
-                        pass
-                elif child.layout():
-                    # Recursively delete potentially nested layout widgets
-                    sub = child.layout()
-                    while sub.count():
-                        subchild = sub.takeAt(0)
-                        if subchild.widget():
-                            w = subchild.widget()
-                            try:
-                                if hasattr(self, 'config_loading') and w is self.config_loading:
-                                    w.setParent(None)
-                                    keep_loading_widget = w
-                                else:
-                                    w.setParent(None)
-                                    w.deleteLater()
-                            except Exception:
-                                pass
-            # Reinsert the loading widget at top if we preserved it
-            if keep_loading_widget is not None:
-                try:
-                    layout.insertWidget(0, keep_loading_widget)
-                except Exception:
-                    try:
-                        layout.addWidget(keep_loading_widget)
-                    except Exception:
-                        pass
+    def _make_apply_fn(self, widget, ftype):
+        """Build the updater used to push a device value into a config widget.
 
-        # Reuse existing layout if present, otherwise create new
-        layout = config_tab.layout()
-        if layout is None:
-            layout = QtWidgets.QVBoxLayout(config_tab)
-            config_tab.setLayout(layout)
+        The widget kind and field type are resolved once at populate time, so
+        per-field updates don't need to re-dispatch on them.
 
-        # Reset widget mapping for this repopulation
-        try:
-            self._config_field_widgets.clear()
-        except Exception:
-            pass
-        # Create scrollable area
-        # Remove any existing scroll area if present
-        # (look for first QScrollArea child and delete it to avoid duplicates)
-        for child in config_tab.findChildren(QtWidgets.QScrollArea):
-            try:
-                child.setParent(None)
-                child.deleteLater()
-            except Exception:
-                pass
+        Args:
+            widget: Widget created for the field in the config tab
+            ftype: CRSF field type the widget was built for
 
-        scroll = QtWidgets.QScrollArea()
-        scroll.setWidgetResizable(True)
-        widget = QtWidgets.QWidget()
-        widget.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        inner_layout = QtWidgets.QVBoxLayout(widget)
-        # Add a small toolbar with a Refresh button at the top of the config tab
-        toolbar = QtWidgets.QHBoxLayout()
-        refresh_btn = QtWidgets.QPushButton("Refresh")
-        refresh_btn.setMaximumWidth(120)
-        toolbar.addWidget(refresh_btn)
-        toolbar.addStretch()
-        # insert toolbar at top of root layout
-        try:
-            layout.addLayout(toolbar)
-        except Exception:
-            pass
-        def _refresh_clicked():
-            try:
-                dev = self.current_device_id if self.current_device_id in self.serThread.elrs_devices else (list(self.serThread.elrs_devices.keys())[0] if self.serThread.elrs_devices else None)
-                if dev is not None:
-                    fields = self.serThread.elrs_devices[dev].get('fields', {})
-                    loaded = self.serThread.elrs_devices[dev].get('loaded', False)
-                    # Always show loading indicator when user clicks refresh
-                    try:
-                        self.config_loading.setVisible(True)
-                    except Exception:
-                        pass
-                    try:
-                        if hasattr(self, '_config_refresh_button'):
-                            self._config_refresh_button.setEnabled(False)
-                    except Exception:
-                        pass
-                    # Trigger a full device reload regardless of loaded flag
-                    try:
-                        self.serThread.request_device_reload(dev)
-                    except Exception as e:
-                        self.onDebug(f"Refresh reload request failed: {e}")
-            except Exception as e:
-                self.onDebug(f"Refresh error: {e}")
-        refresh_btn.clicked.connect(_refresh_clicked)
-        # remember the refresh button for toggling
-        try:
-            self._config_refresh_button = refresh_btn
-        except Exception:
-            pass
-        # Expose refresh function for testing and external calls
+        Returns:
+            Callable taking (dev_value, field)
+        """
+        if isinstance(widget, QtWidgets.QComboBox):
+            if 0 <= ftype <= 8:
+                def apply(dev_value, field):
+                    if dev_value is None:
+                        return
+                    # For numeric types (0-8), dev_value is the actual value held as item data
+                    target_idx = _value_index(widget._values, int(dev_value))
+                    with QSignalBlocker(widget):
+                        widget.setCurrentIndex(target_idx)
+            else:
+                def apply(dev_value, field):
+                    if dev_value is None:
+                        return
+                    # For selection type (9), dev_value is the index
+                    with QSignalBlocker(widget):
+                        widget.setCurrentIndex(int(dev_value))
+        elif isinstance(widget, QtWidgets.QSpinBox):
+            def apply(dev_value, field):
+                if dev_value is None:
+                    return
+                with QSignalBlocker(widget):
+                    widget.setValue(int(dev_value))
+        else:
+            # QLabel / QPushButton
+            def apply(dev_value, field):
+                text_val = field.get('info', field.get('value', ''))
+                widget.setText(str(text_val))
+        return apply
+
+    def _populate_config_tab(self, fields, src):
+        """Schedule a config tab populate, coalescing requests within 50 ms."""
+        self._pending_populate = (fields, src)
+        if not self._populate_timer.isActive():
+            self._populate_timer.start()
+
+    def _do_populate_config_tab(self):
+        if self._pending_populate is None:
+            return
+        fields, src = self._pending_populate
+        self._pending_populate = None
+        config_tab = self.tabs.widget(1)  # Configuration tab
+        # Hold off painting while rows are added/removed; re-enabling updates
+        # schedules a single coalesced repaint of the tab.
+        self.tabs.setUpdatesEnabled(False)
+        config_tab.setUpdatesEnabled(False)
         try:
-            self._refresh_clicked = _refresh_clicked
-        except Exception:
-            pass
+            if self._config_scroll is None:
+                # First populate: build the toolbar and scroll area once. Later
+                # populates reuse them and only touch the rows that changed.
+                self._build_config_tab_chrome(config_tab)
+            self._update_config_rows(fields)
+        finally:
+            config_tab.setUpdatesEnabled(True)
+            self.tabs.setUpdatesEnabled(True)
+
+        # Only set current_device_id for TX modules, not receivers
+        if src in (CRSF_ADDRESS_CRSF_TRANSMITTER, CRSF_ADDRESS_TRANSMITTER_LEGACY):
+            self.current_device_id = src
+
+    def _update_config_rows(self, fields):
+        """Bring the config tab rows in line with the device's fields."""
+        inner_layout = self._config_inner_layout
 
-        # Build map of group layouts for parents (store groupbox and layout)
-        group_layouts = {}
         # Precompute which field ids are used as parents so we can avoid adding
         # duplicate QLabel entries when a folder is represented by a QGroupBox.
-        parents_set = set()
-        for ff in fields.values():
-            try:
-                p = ff.get('parent', 0)
-                if p:
-                    try:
-                        parents_set.add(int(p))
-                    except Exception:
-                        parents_set.add(p)
-            except Exception:
-                pass
+        # Field ids and parent ids are ints (straight from the frame bytes)
+        parents_set = {ff.get('parent', 0) for ff in fields.values() if ff.get('parent', 0)}
+        # Folder titles are looked up by id
+        parent_names = {fid: f.get('name', f'Folder {fid}') for fid, f in fields.items()}
+        sigs = {fid: _config_field_signature(f, fid in parents_set) for fid, f in fields.items()}
+
+        structure = tuple(sigs.items())
+        if structure == self._config_structure:
+            # Same fields in the same shape and order (e.g. a refresh that only
+            # changed values): leave the layout alone and push the values
+            for fid, field in fields.items():
+                try:
+                    self._refresh_config_value(fid, field)
+                except Exception as e:
+                    self.onDebug(f"Error updating field {fid}: {e}")
+            return
+        self._config_structure = None
+
+        # Group boxes for parents persist across populates: parent -> (groupbox, layout)
+        group_layouts = self._config_group_layouts
+        used_parents = set()
+        seen_fids = set()
+        # Last row visited per layout, so new rows are inserted in field order
+        last_in_layout = {}
+
+        def place(row, target_layout):
+            prev = last_in_layout.get(target_layout)
+            target_layout.insertWidget(target_layout.indexOf(prev) + 1 if prev is not None else 0, row)
+            last_in_layout[target_layout] = row
+
         for fid, field in fields.items():
+            seen_fids.add(fid)
             try:
                 name = field.get('name', '')
                 # include Packet Rate in the config tab like any other field
@@ -1478,216 +1822,339 @@ class Main(QtWidgets.QWidget):
                 parent = field.get('parent', 0)
                 # determine which layout to add to (parent grouping)
                 target_layout = inner_layout
-                if parent and parent in group_layouts:
-                    target_layout = group_layouts[parent][1]
-                elif parent and parent not in group_layouts:
-                    # create a new group box placeholder for this parent and add it to root
-                    parent_name = fields.get(parent, {}).get('name', f'Folder {parent}')
-                    group_box = QtWidgets.QGroupBox(str(parent_name))
-                    group_layout = QtWidgets.QVBoxLayout(group_box)
-                    inner_layout.addWidget(group_box)
-                    group_layouts[parent] = (group_box, group_layout)
-                    target_layout = group_layout
-
-                if ftype == 9:  # select/choice
-                    row_layout = QtWidgets.QHBoxLayout()
-                    label = QtWidgets.QLabel(f"{name}:")
-                    combo = NoWheelComboBox()
-                    values = field.get('values', [])
-                    # If this field has a mapped unit and values are plain numeric strings,
-                    # display them with the unit suffix in the UI (but keep the underlying indices the same).
-                    try:
-                        unit = UNIT_MAP.get(name.strip().lower())
-                        display_values = []
-                        for v in values:
-                            if unit and isinstance(v, str) and re.search(r'[A-Za-z%]', v) is None:
-                                # Append unit without whitespace (e.g., 10mW)
-                                display_values.append(f"{v}{unit}")
-                            else:
-                                display_values.append(v)
-                        combo.addItems(display_values)
-                    except Exception:
-                        combo.addItems(values)
-                    # prefer explicit selection index if present
-                    sel_idx = field.get('value', field.get('status', 0))
-                    try:
-                        if isinstance(sel_idx, str):
-                            sel_idx = int(sel_idx)
-                    except Exception:
-                        sel_idx = 0
-                    # Honor any pending write for this field - prefer the user's desired value
-                    pending = self._pending_param_writes.get(int(fid)) if hasattr(self, '_pending_param_writes') else None
-                    if pending:
-                        desired, ts = pending
-                        try:
-                            if 0 <= int(desired) < len(values):
-                                combo.blockSignals(True)
-                                combo.setCurrentIndex(int(desired))
-                                combo.blockSignals(False)
-                        except Exception:
-                            pass
-                    elif 0 <= sel_idx < len(values):
-                        combo.setCurrentIndex(sel_idx)
-                    combo.currentIndexChanged.connect(lambda idx, f=fid: self._on_param_changed(f, idx))
-                    # Save widget reference for targeted updates
-                    try:
-                        self._config_field_widgets[int(fid)] = combo
-                    except Exception:
-                        pass
-                    row_layout.addWidget(label)
-                    row_layout.addWidget(combo)
-                    row_layout.addStretch()
-                    target_layout.addLayout(row_layout)
-                elif ftype == 11:  # info/label
-                    # If this field is used as a folder parent (it owns a groupbox),
-                    # skip adding an extra QLabel inside the group box since the
-                    # QGroupBox already shows the title. We still continue to
-                    # process this field so the group title gets updated below.
-                    if int(fid) in parents_set:
-                        # do not add a duplicate label for a folder header
-                        pass
+                if parent:
+                    # Folder names come from parent_names, which covers every field,
+                    # so the title is right whether or not the folder was visited yet
+                    parent_name = str(parent_names.get(parent, f'Folder {parent}'))
+                    if parent in group_layouts:
+                        group_box = group_layouts[parent][0]
+                        last_in_layout[inner_layout] = group_box
+                        if parent not in used_parents and group_box.title() != parent_name:
+                            # Folder kept from the last populate but renamed since
+                            group_box.setTitle(parent_name)
                     else:
-                        label = QtWidgets.QLabel(f"{name}")
-                        target_layout.addWidget(label)
-                elif 0 <= ftype <= 8:  # numeric value
-                    row_layout = QtWidgets.QHBoxLayout()
-                    label = QtWidgets.QLabel(f"{name}:")
-                    combo = NoWheelComboBox()
-                    # Use parsed min/max/step if present
-                    minv = field.get('min') if field.get('min') is not None else 0
-                    maxv = field.get('max') if field.get('max') is not None else (minv + 100)
-                    stepv = field.get('step') if field.get('step') is not None else 1
-
-                    # Get unit for display
-                    unit = None
-                    try:
-                        unit = UNIT_MAP.get(name.strip().lower())
-                    except Exception:
-                        pass
-
-                    # Generate combo values from min, max, and step
-                    try:
-                        minv = int(minv)
-                        maxv = int(maxv)
-                        stepv = int(stepv) if stepv > 0 else 1
-                        # Limit number of items to prevent UI issues with huge ranges
-                        max_items = 1000
-                        num_items = (maxv - minv) // stepv + 1
-                        if num_items > max_items:
-                            # If too many items, adjust step to fit within limit
-                            stepv = max(1, (maxv - minv) // (max_items - 1))
-
-                        values = []
-                        value_map = {}  # Map display string to actual value
-                        idx = 0
-                        for val in range(minv, maxv + 1, stepv):
-                            if unit:
-                                display_str = f"{val}{unit}"
-                            else:
-                                display_str = str(val)
-                            values.append(display_str)
-                            value_map[idx] = val
-                            idx += 1
-
-                        combo.addItems(values)
-                    except Exception as e:
-                        self.onDebug(f"Error generating numeric combo values: {e}")
-                        # Fallback: just add min and max
-                        values = [str(minv), str(maxv)]
-                        combo.addItems(values)
-                        value_map = {0: minv, 1: maxv}
-
-                    # Set current value
-                    dev_value = int(field.get('value', field.get('status', field.get('default', minv if minv is not None else 0))))
-                    # honor pending write
-                    pending = self._pending_param_writes.get(int(fid)) if hasattr(self, '_pending_param_writes') else None
-                    if pending:
-                        try:
-                            val, ts = pending
-                            dev_value = int(val)
-                        except Exception:
-                            pass
-
-                    # Find the index that matches dev_value
-                    try:
-                        # Find which index in value_map corresponds to dev_value
-                        target_idx = 0
-                        for idx, val in value_map.items():
-                            if val == dev_value:
-                                target_idx = idx
-                                break
-                        combo.blockSignals(True)
-                        combo.setCurrentIndex(target_idx)
-                        combo.blockSignals(False)
-                    except Exception:
-                        pass
-
-                    # Connect on-change to directly call _on_param_changed
-                    def _on_combo_changed(idx, f=fid, vmap=value_map):
-                        try:
-                            actual_value = vmap.get(idx, minv)
-                            self._on_param_changed(f, actual_value)
-                        except Exception as e:
-                            self.onDebug(f"Numeric combo change error: {e}")
-
-                    combo.currentIndexChanged.connect(_on_combo_changed)
+                        # create a new group box placeholder for this parent and add it to root
+                        group_box = QtWidgets.QGroupBox(parent_name)
+                        group_layout = QtWidgets.QVBoxLayout(group_box)
+                        place(group_box, inner_layout)
+                        group_layouts[parent] = (group_box, group_layout)
+                    used_parents.add(parent)
+                    target_layout = group_layouts[parent][1]
 
-                    # Save widget reference for targeted updates
-                    try:
-                        self._config_field_widgets[int(fid)] = combo
-                    except Exception:
-                        pass
+                sig = sigs[fid]
+                if self._config_field_signatures.get(fid) == sig:
+                    # Row was built from the same field shape: keep it and only push the value
+                    row = self._config_field_rows.get(fid)
+                    if row is not None:
+                        last_in_layout[target_layout] = row
+                    self._refresh_config_value(fid, field)
+                    continue
+                # New field, or its shape changed: drop the old row and build a fresh one
+                self._remove_config_row(fid)
+                builder = self._config_row_builders.get(ftype, self._build_unknown_row)
+                row = builder(fid, field, fid in parents_set)
+
+                self._config_field_signatures[fid] = sig
+                if row is not None:
+                    place(row, target_layout)
+                    self._config_field_rows[fid] = row
+            except Exception as e:
+                self.onDebug(f"Error adding field {fid}: {e}")
 
-                    row_layout.addWidget(label)
-                    row_layout.addWidget(combo)
-                    row_layout.addStretch()
-                    target_layout.addLayout(row_layout)
-                elif ftype == 12:  # string info (read-only)
-                    value = field.get('value', '')
-                    label = QtWidgets.QLabel(f"{name}: {value}")
-                    # Allow strings to be editable via context menu / popup (future)
-                    target_layout.addWidget(label)
-                    try:
-                        self._config_field_widgets[int(fid)] = label
-                    except Exception:
-                        pass
-                elif ftype == 13:  # command/button
-                    button = QtWidgets.QPushButton(f"{name}")
-                    button.clicked.connect(lambda checked, f=fid: self._on_param_changed(f, 1))  # Assume toggle or something
-                    target_layout.addWidget(button)
-                    try:
-                        self._config_field_widgets[int(fid)] = button
-                    except Exception:
-                        pass
-                else:
-                    label = QtWidgets.QLabel(f"{name} (type {ftype})")
-                    target_layout.addWidget(label)
-                    try:
-                        self._config_field_widgets[int(fid)] = label
-                    except Exception:
-                        pass
+        # Drop rows for fields the device no longer reports, then any folder left empty
+        for fid in set(self._config_field_signatures) - seen_fids:
+            self._remove_config_row(fid)
+        for parent in set(group_layouts) - used_parents:
+            group_box, _ = group_layouts.pop(parent)
+            group_box.setParent(None)
+            group_box.deleteLater()
+        self._config_structure = structure
+        self._schedule_config_realize()
+
+    def _build_combo_row(self, fid, field, is_folder):
+        """Select/choice (9) or numeric (0-8) field.
+
+        Combo rows start as a sized placeholder with just the label; the combo
+        is built once the row scrolls near the viewport.
+        """
+        self._config_placeholders[fid] = field
+        return _ConfigRow(f"{field.get('name', '')}:", self._config_row_height)
+
+    def _build_info_row(self, fid, field, is_folder):
+        """Info/label (11) field."""
+        # If this field is used as a folder parent (it owns a groupbox), skip
+        # adding an extra QLabel inside the group box since the QGroupBox
+        # already shows the title.
+        if is_folder:
+            return None
+        return QtWidgets.QLabel(f"{field.get('name', '')}")
+
+    def _build_string_row(self, fid, field, is_folder):
+        """String info (12) field, read-only."""
+        label = QtWidgets.QLabel(f"{field.get('name', '')}: {field.get('value', '')}")
+        # Allow strings to be editable via context menu / popup (future)
+        label._apply_device_value = self._make_apply_fn(label, 12)
+        self._config_field_widgets[fid] = label
+        return label
+
+    def _build_command_row(self, fid, field, is_folder):
+        """Command (13) field, shown as a button."""
+        button = QtWidgets.QPushButton(f"{field.get('name', '')}")
+        button.clicked.connect(lambda checked, f=fid: self._on_param_changed(f, 1))  # Assume toggle or something
+        button._apply_device_value = self._make_apply_fn(button, 13)
+        self._config_field_widgets[fid] = button
+        return button
+
+    def _build_unknown_row(self, fid, field, is_folder):
+        """Field of a type without a dedicated widget."""
+        ftype = field.get('type', 0)
+        label = QtWidgets.QLabel(f"{field.get('name', '')} (type {ftype})")
+        label._apply_device_value = self._make_apply_fn(label, ftype)
+        self._config_field_widgets[fid] = label
+        return label
+
+    def _refresh_config_value(self, fid, field):
+        """Push a field's current value into its existing config row.
+
+        Rows with a pending write keep showing the user's choice.
+        """
+        if fid in self._config_placeholders:
+            # Not built yet: it will be built from the latest field
+            self._config_placeholders[fid] = field
+            return
+        ftype = field.get('type', 0)
+        widget = self._config_field_widgets.get(fid)
+        if widget is not None and (ftype == 9 or 0 <= ftype <= 8) \
+                and fid not in self._pending_param_writes:
+            dev_value = field.get('value', field.get('status', None))
+            widget._apply_device_value(dev_value, field)
+
+    def _schedule_config_realize(self, *_):
+        """Debounce building placeholder rows after scrolls, resizes and populates."""
+        if self._config_placeholders:
+            self._config_realize_timer.start()
+
+    def _realize_visible_config_rows(self):
+        """Build the combo rows that are within reach of the config tab viewport."""
+        scroll = self._config_scroll
+        if scroll is None or self.tabs.currentIndex() != 1:
+            return
+        # Rows inserted by the last populate may not have grown the scroll
+        # widget yet; have the scroll area resize it so row positions are current.
+        QtCore.QCoreApplication.sendEvent(scroll, QtCore.QEvent(QtCore.QEvent.LayoutRequest))
+        viewport = scroll.viewport()
+        # Build a margin beyond the visible area so short scrolls don't show placeholders
+        top = -200
+        bottom = viewport.height() + 200
+        for fid, field in list(self._config_placeholders.items()):
+            row = self._config_field_rows.get(fid)
+            y = row.mapTo(viewport, QPoint(0, 0)).y()
+            if y + row.height() < top or y > bottom:
+                continue
+            del self._config_placeholders[fid]
+            try:
+                self._fill_combo_row(row, fid, field)
             except Exception as e:
                 self.onDebug(f"Error adding field {fid}: {e}")
-            # If this field is a folder that had a placeholder group, update its name
+            # Size later placeholders like the real rows. The new combo is only
+            # shown on a later event, so the row's own hint doesn't include it
+            # yet; measure the combo instead.
+            if row.combo is not None:
+                self._config_row_height = max(row.combo.sizeHint().height(), 1)
+
+    def _fill_combo_row(self, row, fid, field):
+        """Build the combo for a select or numeric field into its row."""
+        ftype = field.get('type', 0)
+        # Unit suffix for display, shared by both combo kinds
+        unit = _unit_for(field.get('name', ''))
+        if ftype == 9:  # select/choice
+            combo = NoWheelComboBox()
+            values = field.get('values', [])
+            # If this field has a mapped unit and values are plain numeric strings,
+            # display them with the unit suffix in the UI (but keep the underlying indices the same).
+            # Append unit without whitespace (e.g., 10mW)
+            if unit:
+                display_values = [f"{v}{unit}" if isinstance(v, str) and not _has_letter(v) else v
+                                  for v in values]
+            else:
+                display_values = values
+            combo.addItems(display_values)
+            # prefer explicit selection index if present
+            sel_idx = field.get('value', field.get('status', 0))
+            if isinstance(sel_idx, str):
+                sel_idx = int(sel_idx) if sel_idx.lstrip('-').isdigit() else 0
+            # Honor any pending write for this field - prefer the user's desired value
+            pending = self._pending_param_writes.get(fid)
+            if pending:
+                desired = int(pending[0])
+                if 0 <= desired < len(values):
+                    combo.setCurrentIndex(desired)
+            elif 0 <= sel_idx < len(values):
+                combo.setCurrentIndex(sel_idx)
+            combo.currentIndexChanged.connect(functools.partial(self._on_param_changed, fid))
+            # Save widget reference for targeted updates
+            combo._apply_device_value = self._make_apply_fn(combo, ftype)
+            self._config_field_widgets[fid] = combo
+            row.set_combo(combo)
+        else:  # numeric value
+            # Use parsed min/max/step if present
+            minv = field.get('min') if field.get('min') is not None else 0
+            maxv = field.get('max') if field.get('max') is not None else (minv + 100)
+            stepv = field.get('step') if field.get('step') is not None else 1
+
+            # Wide ranges get a spin box rather than hundreds of combo items
             try:
-                if fid in group_layouts:
-                    # group_layouts[fid] = (group_box, layout)
-                    group_layouts[fid][0].setTitle(str(field.get('name', f'Folder {fid}')))
-            except Exception:
+                if (int(maxv) - int(minv)) // max(int(stepv), 1) + 1 > NUMERIC_COMBO_MAX_ITEMS:
+                    self._fill_spin_row(row, fid, field, int(minv), int(maxv), max(int(stepv), 1), unit)
+                    return
+            except (TypeError, ValueError):
                 pass
 
-        inner_layout.addStretch()
+            combo = NoWheelComboBox()
+            # Generate combo values from min, max, and step
+            try:
+                minv = int(minv)
+                maxv = int(maxv)
+                stepv = int(stepv) if stepv > 0 else 1
+                # Each item carries its actual value as item data
+                values, item_values = _numeric_combo_items(minv, maxv, stepv, unit)
+                for display_str, val in zip(values, item_values):
+                    combo.addItem(display_str, val)
+            except Exception as e:
+                self.onDebug(f"Error generating numeric combo values: {e}")
+                # Fallback: just add min and max
+                combo.clear()
+                item_values = (minv, maxv)
+                combo.addItem(str(minv), minv)
+                combo.addItem(str(maxv), maxv)
+            # Item values in index order, for value -> index lookups
+            combo._values = item_values
+
+            # Set current value
+            dev_value = int(field.get('value', field.get('status', field.get('default', minv if minv is not None else 0))))
+            # honor pending write
+            pending = self._pending_param_writes.get(fid)
+            if pending:
+                dev_value = int(pending[0])
+
+            # Find the index that matches dev_value (before the change handler is connected)
+            combo.setCurrentIndex(_value_index(item_values, dev_value))
+
+            combo.currentIndexChanged.connect(functools.partial(self._on_numeric_combo_changed, fid, combo))
+
+            # Save widget reference for targeted updates
+            combo._apply_device_value = self._make_apply_fn(combo, ftype)
+            self._config_field_widgets[fid] = combo
+
+            row.set_combo(combo)
+
+    def _on_numeric_combo_changed(self, fid, combo, idx):
+        """Write the value behind the selected item of a numeric combo."""
+        try:
+            actual_value = combo.itemData(idx)
+            if actual_value is None:
+                return
+            self._on_param_changed(fid, actual_value)
+        except Exception as e:
+            self.onDebug(f"Numeric combo change error: {e}")
+
+    def _on_spin_changed(self, fid, spin, minv, maxv, stepv, value):
+        """Write a numeric spin box value, snapped to the field's step grid.
+
+        Typed values can fall between steps (e.g. 7 with a step of 5), which
+        the device never offers; the nearest step is written and shown instead.
+        """
+        snapped = minv + round((value - minv) / stepv) * stepv
+        if snapped > maxv:
+            snapped -= stepv
+        if snapped != value:
+            with QSignalBlocker(spin):
+                spin.setValue(snapped)
+        self._on_param_changed(fid, snapped)
+
+    def _fill_spin_row(self, row, fid, field, minv, maxv, stepv, unit):
+        """Build a spin box for a numeric field with a wide range into its row.
+
+        Args:
+            row: Placeholder row to fill
+            fid: Field id
+            field: Parsed parameter field dict
+            minv: Minimum value
+            maxv: Maximum value
+            stepv: Step between values (> 0)
+            unit: Unit suffix for display, or None
+        """
+        spin = NoWheelSpinBox()
+        spin.setRange(minv, maxv)
+        spin.setSingleStep(stepv)
+        if unit:
+            spin.setSuffix(unit)
+        # Typed values are only reported once editing finishes, not per keystroke
+        spin.setKeyboardTracking(False)
+
+        dev_value = int(field.get('value', field.get('status', field.get('default', minv))))
+        # honor pending write
+        pending = self._pending_param_writes.get(fid)
+        if pending:
+            dev_value = int(pending[0])
+        spin.setValue(dev_value)
+
+        spin.valueChanged.connect(functools.partial(self._on_spin_changed, fid, spin, minv, maxv, stepv))
+        spin._apply_device_value = self._make_apply_fn(spin, field.get('type', 0))
+        self._config_field_widgets[fid] = spin
+        row.set_combo(spin)
+
+    def _remove_config_row(self, fid):
+        """Delete the config tab row built for a field, if any."""
+        row = self._config_field_rows.pop(fid, None)
+        self._config_field_widgets.pop(fid, None)
+        self._config_placeholders.pop(fid, None)
+        self._config_field_signatures.pop(fid, None)
+        if row is not None:
+            row.setParent(None)
+            row.deleteLater()
+
+    def _refresh_clicked(self):
+        """Ask the current device to reload its parameters (Refresh button)."""
+        try:
+            dev = self.current_device_id if self.current_device_id in self.serThread.elrs_devices else (list(self.serThread.elrs_devices.keys())[0] if self.serThread.elrs_devices else None)
+            if dev is not None:
+                # Always show loading indicator when user clicks refresh
+                try:
+                    self.config_loading.setVisible(True)
+                except Exception:
+                    pass
+                try:
+                    self._config_refresh_button.setEnabled(False)
+                except Exception:
+                    pass
+                # Trigger a full device reload regardless of loaded flag
+                try:
+                    self.serThread.request_device_reload(dev)
+                except Exception as e:
+                    self.onDebug(f"Refresh reload request failed: {e}")
+        except Exception as e:
+            self.onDebug(f"Refresh error: {e}")
 
+    def _build_config_tab_chrome(self, config_tab):
+        """Create the scroll area that holds the config rows."""
+        layout = config_tab.layout()
+
+        # Create scrollable area (only once; later populates reuse it, which
+        # also keeps the scroll position across refreshes)
+        scroll = QtWidgets.QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.verticalScrollBar().valueChanged.connect(self._schedule_config_realize)
+        scroll.verticalScrollBar().rangeChanged.connect(self._schedule_config_realize)
+        widget = QtWidgets.QWidget()
+        widget.setSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        inner_layout = QtWidgets.QVBoxLayout(widget)
+        inner_layout.addStretch()
         scroll.setWidget(widget)
         layout.addWidget(scroll)
-        # Only set current_device_id for TX modules, not receivers
-        if src in (CRSF_ADDRESS_CRSF_TRANSMITTER, CRSF_ADDRESS_TRANSMITTER_LEGACY):
-            self.current_device_id = src
-        config_tab.update()
-        self.tabs.update()
-        self.tabs.repaint()
-        widget.update()
-        scroll.update()
+        self._config_scroll = scroll
+        self._config_inner_widget = widget
+        self._config_inner_layout = inner_layout
 
 # -------------------------------------------------------------------
 
@@ -1765,371 +2232,425 @@ def create_checkmark_icon(color='#ffffff', size=16):
     return QIcon(pixmap)
 
 
+# Dark theme applied to the whole application. The {..._path} placeholders are
+# filled in by _build_dark_stylesheet; every other brace is literal QSS.
+_DARK_STYLESHEET_TEMPLATE = """
+QWidget {
+    background-color: #2b2b2b;
+    color: #e0e0e0;
+    font-family: Segoe UI, Arial, sans-serif;
+}
+
+QMainWindow, QDialog {
+    background-color: #2b2b2b;
+}
+
+QLabel {
+    color: #e0e0e0;
+    background-color: transparent;
+}
+
+QPushButton {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    border-radius: 4px;
+    padding: 2px 8px;
+    min-height: 20px;
+    font-size: 8pt;
+}
+
+QPushButton:hover {
+    background-color: #4a4a4a;
+    border: 1px solid #666666;
+}
+
+QPushButton:pressed {
+    background-color: #2a2a2a;
+}
+
+QPushButton:disabled {
+    background-color: #2b2b2b;
+    color: #666666;
+    border: 1px solid #3c3c3c;
+}
+
+QLineEdit, QSpinBox, QDoubleSpinBox {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    padding: 3px;
+    selection-background-color: #0d47a1;
+}
+
+QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {
+    border: 1px solid #1e88e5;
+}
+
+QLineEdit:disabled, QSpinBox:disabled, QDoubleSpinBox:disabled, QComboBox:disabled {
+    background-color: #2b2b2b;
+    color: #666666;
+}
+
+QComboBox {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    padding: 1px 5px;
+    min-height: 20px;
+}
+
+QComboBox:hover {
+    border: 1px solid #666666;
+}
+
+QComboBox::drop-down {
+    subcontrol-origin: padding;
+    subcontrol-position: top right;
+    width: 20px;
+    border-left: 1px solid #555555;
+    background-color: #3c3c3c;
+    border-top-right-radius: 3px;
+    border-bottom-right-radius: 3px;
+}
+
+QComboBox::down-arrow, QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {
+    image: url({down_arrow_path});
+    width: 12px;
+    height: 12px;
+}
+
+QComboBox::down-arrow:disabled, QSpinBox::down-arrow:disabled, QDoubleSpinBox::down-arrow:disabled {
+    image: url({down_arrow_disabled_path});
+}
+
+QComboBox QAbstractItemView {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    selection-background-color: #0d47a1;
+    selection-color: #ffffff;
+    border: 1px solid #555555;
+}
+
+QCheckBox {
+    color: #e0e0e0;
+    spacing: 5px;
+}
+
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+    border: 2px solid #555555;
+    border-radius: 3px;
+    background-color: #3c3c3c;
+}
+
+QCheckBox::indicator:hover {
+    border: 2px solid #666666;
+}
+
+QCheckBox::indicator:checked {
+    background-color: #1e88e5;
+    border: 2px solid #1e88e5;
+    image: url({checkmark_path});
+}
+
+QCheckBox::indicator:disabled {
+    background-color: #2b2b2b;
+    border: 2px solid #3c3c3c;
+}
+
+QCheckBox::indicator:checked:disabled {
+    background-color: #2b2b2b;
+    border: 2px solid #3c3c3c;
+    image: url({checkmark_disabled_path});
+}
+
+QProgressBar {
+    background-color: #3c3c3c;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    text-align: center;
+    color: #e0e0e0;
+}
+
+QProgressBar::chunk {
+    background-color: #1e88e5;
+    border-radius: 2px;
+}
+
+QGroupBox {
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+    font-weight: bold;
+}
+
+QGroupBox::title {
+    subcontrol-origin: margin;
+    subcontrol-position: top left;
+    left: 10px;
+    padding: 0 5px;
+    background-color: #2b2b2b;
+}
+
+QTabWidget::pane {
+    border: 1px solid #555555;
+    background-color: #2b2b2b;
+    border-radius: 3px;
+}
+
+QTabBar::tab {
+    background-color: #3c3c3c;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    border-bottom: none;
+    padding: 8px 20px;
+    margin-right: 2px;
+    border-top-left-radius: 4px;
+    border-top-right-radius: 4px;
+}
+
+QTabBar::tab:selected {
+    background-color: #2b2b2b;
+    border-bottom: 2px solid #1e88e5;
+}
+
+QTabBar::tab:hover:!selected {
+    background-color: #4a4a4a;
+}
+
+QTabBar::tab:disabled {
+    background-color: #2b2b2b;
+    color: #666666;
+    border: 1px solid #3c3c3c;
+}
+
+QPlainTextEdit, QTextEdit {
+    background-color: #1e1e1e;
+    color: #e0e0e0;
+    border: 1px solid #555555;
+    border-radius: 3px;
+    selection-background-color: #0d47a1;
+}
+
+QScrollArea {
+    background-color: #2b2b2b;
+    border: none;
+}
+
+QScrollBar:vertical {
+    background-color: #222222;
+    width: 10px;
+    border: none;
+    margin: 0px;
+}
+
+QScrollBar::handle:vertical {
+    background-color: #4a4a4a;
+    border-radius: 5px;
+    min-height: 30px;
+    margin: 2px 2px 2px 2px;
+}
+
+QScrollBar::handle:vertical:hover, QScrollBar::handle:horizontal:hover {
+    background-color: #5a5a5a;
+}
+
+QScrollBar::handle:vertical:pressed, QScrollBar::handle:horizontal:pressed {
+    background-color: #6a6a6a;
+}
+
+QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+    height: 0px;
+    border: none;
+    background: none;
+}
+
+QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical,
+QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {
+    background: none;
+}
+
+QScrollBar:horizontal {
+    background-color: #222222;
+    height: 10px;
+    border: none;
+    margin: 0px;
+}
+
+QScrollBar::handle:horizontal {
+    background-color: #4a4a4a;
+    border-radius: 5px;
+    min-width: 30px;
+    margin: 2px 2px 2px 2px;
+}
+
+QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+    width: 0px;
+    border: none;
+    background: none;
+}
+
+QFrame[frameShape="4"], QFrame[frameShape="5"] {
+    color: #555555;
+}
+
+QSpinBox::up-button, QDoubleSpinBox::up-button,
+QSpinBox::down-button, QDoubleSpinBox::down-button {
+    background-color: #3c3c3c;
+    border-left: 1px solid #555555;
+    width: 16px;
+}
+
+QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover,
+QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {
+    background-color: #4a4a4a;
+}
+
+QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {
+    image: url({up_arrow_path});
+    width: 12px;
+    height: 12px;
+}
+
+QSpinBox::up-arrow:disabled, QDoubleSpinBox::up-arrow:disabled {
+    image: url({up_arrow_disabled_path});
+}
+"""
+
+_QSS_WHITESPACE = re.compile(r'\s+')
+_QSS_PUNCT_SPACE = re.compile(r' ?([{};:,]) ?')
+
+
+def _minify_qss(qss):
+    """Collapse the indentation and blank lines out of a stylesheet.
+
+    Args:
+        qss: Stylesheet text
+
+    Returns:
+        Equivalent stylesheet with no whitespace around punctuation
+    """
+    return _QSS_PUNCT_SPACE.sub(r'\1', _QSS_WHITESPACE.sub(' ', qss)).strip()
+
+
+# Template minified and split once into literal text and placeholder names
+# (alternating), so Qt's parser has less text to walk on every setStyleSheet
+_DARK_STYLESHEET_PARTS = tuple(re.split(r'\{(\w+_path)\}', _minify_qss(_DARK_STYLESHEET_TEMPLATE)))
+
+
+# Icons referenced by the dark stylesheet:
+# (template placeholder, cache file name, icon factory, pixmap size)
+STYLESHEET_ICONS = (
+    ('down_arrow_path', 'arrow_down_e0e0e0_12.png', functools.partial(create_arrow_icon, 'down', '#e0e0e0', 12), 12),
+    ('up_arrow_path', 'arrow_up_e0e0e0_12.png', functools.partial(create_arrow_icon, 'up', '#e0e0e0', 12), 12),
+    ('down_arrow_disabled_path', 'arrow_down_555555_12.png', functools.partial(create_arrow_icon, 'down', '#555555', 12), 12),
+    ('up_arrow_disabled_path', 'arrow_up_555555_12.png', functools.partial(create_arrow_icon, 'up', '#555555', 12), 12),
+    ('checkmark_path', 'checkmark_ffffff_14.png', functools.partial(create_checkmark_icon, '#ffffff', 14), 14),
+    ('checkmark_disabled_path', 'checkmark_555555_14.png', functools.partial(create_checkmark_icon, '#555555', 14), 14),
+)
+
+
+def _provision_icons(icon_dir):
+    """Make sure every stylesheet icon exists in a directory.
+
+    Icons that are missing, empty or can't be decoded (e.g. a truncated file
+    left in the cache) are rendered again.
+
+    Args:
+        icon_dir: Directory holding the icon PNGs
+
+    Returns:
+        Tuple (paths, ok): dict mapping template placeholder to icon path, and
+        False if any icon could not be written
+    """
+    ok = True
+    paths = {}
+    for key, name, make_icon, size in STYLESHEET_ICONS:
+        path = os.path.join(icon_dir, name).replace('\\', '/')
+        if QImage(path).isNull() and not make_icon().pixmap(size, size).save(path):
+            ok = False
+        paths[key] = path
+    return paths, ok
+
+
+@functools.lru_cache(maxsize=4)
+def _build_dark_stylesheet(down_arrow_path, up_arrow_path, down_arrow_disabled_path,
+                           up_arrow_disabled_path, checkmark_path, checkmark_disabled_path):
+    """Fill the icon paths into the dark stylesheet template.
+
+    Args:
+        down_arrow_path: Combo/spin box down arrow
+        up_arrow_path: Spin box up arrow
+        down_arrow_disabled_path: Down arrow for disabled widgets
+        up_arrow_disabled_path: Up arrow for disabled widgets
+        checkmark_path: Check box checkmark
+        checkmark_disabled_path: Checkmark for disabled check boxes
+
+    Returns:
+        Stylesheet string for QApplication.setStyleSheet
+    """
+    paths = {
+        'down_arrow_path': down_arrow_path,
+        'up_arrow_path': up_arrow_path,
+        'down_arrow_disabled_path': down_arrow_disabled_path,
+        'up_arrow_disabled_path': up_arrow_disabled_path,
+        'checkmark_path': checkmark_path,
+        'checkmark_disabled_path': checkmark_disabled_path,
+    }
+    parts = list(_DARK_STYLESHEET_PARTS)
+    # Odd entries are placeholder names
+    parts[1::2] = [paths[name] for name in parts[1::2]]
+    return "".join(parts)
+
+
+def _apply_stylesheet(app, qss):
+    """Set the application stylesheet unless it is already the one applied.
+
+    Every setStyleSheet call makes Qt re-parse the QSS and re-polish all
+    widgets, even when the text is unchanged.
+
+    Args:
+        app: QApplication instance
+        qss: Stylesheet string
+    """
+    if app.styleSheet() != qss:
+        app.setStyleSheet(qss)
+
+
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
 
-    # Create temporary directory for icons
-    temp_dir = tempfile.mkdtemp()
-
-    # Create and save arrow icons
-    down_arrow = create_arrow_icon('down', '#e0e0e0', 12)
-    up_arrow = create_arrow_icon('up', '#e0e0e0', 12)
-    down_arrow_disabled = create_arrow_icon('down', '#555555', 12)
-    up_arrow_disabled = create_arrow_icon('up', '#555555', 12)
-    checkmark = create_checkmark_icon('#ffffff', 14)
-    checkmark_disabled = create_checkmark_icon('#555555', 14)
-
-    down_arrow_path = os.path.join(temp_dir, 'down_arrow.png').replace('\\', '/')
-    up_arrow_path = os.path.join(temp_dir, 'up_arrow.png').replace('\\', '/')
-    down_arrow_disabled_path = os.path.join(temp_dir, 'down_arrow_disabled.png').replace('\\', '/')
-    up_arrow_disabled_path = os.path.join(temp_dir, 'up_arrow_disabled.png').replace('\\', '/')
-    checkmark_path = os.path.join(temp_dir, 'checkmark.png').replace('\\', '/')
-    checkmark_disabled_path = os.path.join(temp_dir, 'checkmark_disabled.png').replace('\\', '/')
-
-    down_arrow.pixmap(12, 12).save(down_arrow_path)
-    up_arrow.pixmap(12, 12).save(up_arrow_path)
-    down_arrow_disabled.pixmap(12, 12).save(down_arrow_disabled_path)
-    up_arrow_disabled.pixmap(12, 12).save(up_arrow_disabled_path)
-    checkmark.pixmap(14, 14).save(checkmark_path)
-    checkmark_disabled.pixmap(14, 14).save(checkmark_disabled_path)
+    # Stylesheet icons are rendered once and kept in the user cache directory;
+    # fall back to a temporary directory if there is no cache location or
+    # the icons can't be written there
+    icons_ok = False
+    cache_root = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    if cache_root:
+        icon_dir = os.path.join(cache_root, 'usb_jr_bay', 'icons')
+        try:
+            os.makedirs(icon_dir, exist_ok=True)
+            icon_paths, icons_ok = _provision_icons(icon_dir)
+        except OSError:
+            pass
+    if not icons_ok:
+        icon_dir = tempfile.mkdtemp()
+        # Removed at interpreter exit rather than holding up window close
+        atexit.register(shutil.rmtree, icon_dir, True)
+        icon_paths, icons_ok = _provision_icons(icon_dir)
 
     # Apply dark theme
-    dark_stylesheet = """
-    QWidget {{
-        background-color: #2b2b2b;
-        color: #e0e0e0;
-        font-family: Segoe UI, Arial, sans-serif;
-    }}
-
-    QMainWindow, QDialog {{
-        background-color: #2b2b2b;
-    }}
-
-    QLabel {{
-        color: #e0e0e0;
-        background-color: transparent;
-    }}
-
-    QPushButton {{
-        background-color: #3c3c3c;
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        border-radius: 4px;
-        padding: 2px 8px;
-        min-height: 20px;
-        font-size: 8pt;
-    }}
-
-    QPushButton:hover {{
-        background-color: #4a4a4a;
-        border: 1px solid #666666;
-    }}
-
-    QPushButton:pressed {{
-        background-color: #2a2a2a;
-    }}
-
-    QPushButton:disabled {{
-        background-color: #2b2b2b;
-        color: #666666;
-        border: 1px solid #3c3c3c;
-    }}
-
-    QLineEdit, QSpinBox, QDoubleSpinBox {{
-        background-color: #3c3c3c;
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        padding: 3px;
-        selection-background-color: #0d47a1;
-    }}
-
-    QLineEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus {{
-        border: 1px solid #1e88e5;
-    }}
-
-    QLineEdit:disabled, QSpinBox:disabled, QDoubleSpinBox:disabled {{
-        background-color: #2b2b2b;
-        color: #666666;
-    }}
-
-    QComboBox {{
-        background-color: #3c3c3c;
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        padding: 1px 5px;
-        min-height: 20px;
-    }}
-
-    QComboBox:hover {{
-        border: 1px solid #666666;
-    }}
-
-    QComboBox:disabled {{
-        background-color: #2b2b2b;
-        color: #666666;
-    }}
-
-    QComboBox::drop-down {{
-        subcontrol-origin: padding;
-        subcontrol-position: top right;
-        width: 20px;
-        border-left: 1px solid #555555;
-        background-color: #3c3c3c;
-        border-top-right-radius: 3px;
-        border-bottom-right-radius: 3px;
-    }}
-
-    QComboBox::down-arrow {{
-        image: url({down_arrow_path});
-        width: 12px;
-        height: 12px;
-    }}
-
-    QComboBox::down-arrow:disabled {{
-        image: url({down_arrow_disabled_path});
-    }}
-
-    QComboBox QAbstractItemView {{
-        background-color: #3c3c3c;
-        color: #e0e0e0;
-        selection-background-color: #0d47a1;
-        selection-color: #ffffff;
-        border: 1px solid #555555;
-    }}
-
-    QCheckBox {{
-        color: #e0e0e0;
-        spacing: 5px;
-    }}
-
-    QCheckBox::indicator {{
-        width: 18px;
-        height: 18px;
-        border: 2px solid #555555;
-        border-radius: 3px;
-        background-color: #3c3c3c;
-    }}
-
-    QCheckBox::indicator:hover {{
-        border: 2px solid #666666;
-    }}
-
-    QCheckBox::indicator:checked {{
-        background-color: #1e88e5;
-        border: 2px solid #1e88e5;
-        image: url({checkmark_path});
-    }}
-
-    QCheckBox::indicator:disabled {{
-        background-color: #2b2b2b;
-        border: 2px solid #3c3c3c;
-    }}
-
-    QCheckBox::indicator:checked:disabled {{
-        background-color: #2b2b2b;
-        border: 2px solid #3c3c3c;
-        image: url({checkmark_disabled_path});
-    }}
-
-    QProgressBar {{
-        background-color: #3c3c3c;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        text-align: center;
-        color: #e0e0e0;
-    }}
-
-    QProgressBar::chunk {{
-        background-color: #1e88e5;
-        border-radius: 2px;
-    }}
-
-    QGroupBox {{
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        border-radius: 5px;
-        margin-top: 10px;
-        padding-top: 10px;
-        font-weight: bold;
-    }}
-
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        subcontrol-position: top left;
-        left: 10px;
-        padding: 0 5px;
-        background-color: #2b2b2b;
-    }}
-
-    QTabWidget::pane {{
-        border: 1px solid #555555;
-        background-color: #2b2b2b;
-        border-radius: 3px;
-    }}
-
-    QTabBar::tab {{
-        background-color: #3c3c3c;
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        border-bottom: none;
-        padding: 8px 20px;
-        margin-right: 2px;
-        border-top-left-radius: 4px;
-        border-top-right-radius: 4px;
-    }}
-
-    QTabBar::tab:selected {{
-        background-color: #2b2b2b;
-        border-bottom: 2px solid #1e88e5;
-    }}
-
-    QTabBar::tab:hover:!selected {{
-        background-color: #4a4a4a;
-    }}
-
-    QTabBar::tab:disabled {{
-        background-color: #2b2b2b;
-        color: #666666;
-        border: 1px solid #3c3c3c;
-    }}
-
-    QPlainTextEdit, QTextEdit {{
-        background-color: #1e1e1e;
-        color: #e0e0e0;
-        border: 1px solid #555555;
-        border-radius: 3px;
-        selection-background-color: #0d47a1;
-    }}
-
-    QScrollArea {{
-        background-color: #2b2b2b;
-        border: none;
-    }}
-
-    QScrollBar:vertical {{
-        background-color: #222222;
-        width: 10px;
-        border: none;
-        margin: 0px;
-    }}
-
-    QScrollBar::handle:vertical {{
-        background-color: #4a4a4a;
-        border-radius: 5px;
-        min-height: 30px;
-        margin: 2px 2px 2px 2px;
-    }}
-
-    QScrollBar::handle:vertical:hover {{
-        background-color: #5a5a5a;
-    }}
-
-    QScrollBar::handle:vertical:pressed {{
-        background-color: #6a6a6a;
-    }}
-
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-        height: 0px;
-        border: none;
-        background: none;
-    }}
-
-    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-        background: none;
-    }}
-
-    QScrollBar:horizontal {{
-        background-color: #222222;
-        height: 10px;
-        border: none;
-        margin: 0px;
-    }}
-
-    QScrollBar::handle:horizontal {{
-        background-color: #4a4a4a;
-        border-radius: 5px;
-        min-width: 30px;
-        margin: 2px 2px 2px 2px;
-    }}
-
-    QScrollBar::handle:horizontal:hover {{
-        background-color: #5a5a5a;
-    }}
-
-    QScrollBar::handle:horizontal:pressed {{
-        background-color: #6a6a6a;
-    }}
-
-    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-        width: 0px;
-        border: none;
-        background: none;
-    }}
-
-    QScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {{
-        background: none;
-    }}
-
-    QFrame[frameShape="4"], QFrame[frameShape="5"] {{
-        color: #555555;
-    }}
-
-    QSpinBox::up-button, QDoubleSpinBox::up-button {{
-        background-color: #3c3c3c;
-        border-left: 1px solid #555555;
-        width: 16px;
-    }}
-
-    QSpinBox::up-button:hover, QDoubleSpinBox::up-button:hover {{
-        background-color: #4a4a4a;
-    }}
-
-    QSpinBox::down-button, QDoubleSpinBox::down-button {{
-        background-color: #3c3c3c;
-        border-left: 1px solid #555555;
-        width: 16px;
-    }}
-
-    QSpinBox::down-button:hover, QDoubleSpinBox::down-button:hover {{
-        background-color: #4a4a4a;
-    }}
-
-    QSpinBox::up-arrow, QDoubleSpinBox::up-arrow {{
-        image: url({up_arrow_path});
-        width: 12px;
-        height: 12px;
-    }}
-
-    QSpinBox::up-arrow:disabled, QDoubleSpinBox::up-arrow:disabled {{
-        image: url({up_arrow_disabled_path});
-    }}
-
-    QSpinBox::down-arrow, QDoubleSpinBox::down-arrow {{
-        image: url({down_arrow_path});
-        width: 12px;
-        height: 12px;
-    }}
-
-    QSpinBox::down-arrow:disabled, QDoubleSpinBox::down-arrow:disabled {{
-        image: url({down_arrow_disabled_path});
-    }}
-    """.format(down_arrow_path=down_arrow_path, up_arrow_path=up_arrow_path,
-               down_arrow_disabled_path=down_arrow_disabled_path, up_arrow_disabled_path=up_arrow_disabled_path,
-               checkmark_path=checkmark_path, checkmark_disabled_path=checkmark_disabled_path)
-
-    app.setStyleSheet(dark_stylesheet)
+    dark_stylesheet = _build_dark_stylesheet(**icon_paths)
 
+    # Applied once the window is built so its widgets are polished in a
+    # single pass, but before show() so the first frame is already themed
     w = Main()
+    _apply_stylesheet(app, dark_stylesheet)
     w.show()
 
-    exit_code = app.exec_()
-
-    # Clean up temporary files
-    try:
-        shutil.rmtree(temp_dir, ignore_errors=True)
-    except Exception:
-        pass
-
-    sys.exit(exit_code)
+    sys.exit(app.exec_())
@@ -7,6 +7,15 @@ This module manages joystick device detection, connection, and input reading.
 import pygame
 from PyQt5 import QtCore
 
+# Events SDL posts when a joystick's axes, buttons or hats change
+JOY_INPUT_EVENTS = frozenset((
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+    pygame.JOYHATMOTION,
+))
+
 
 class JoystickHandler(QtCore.QObject):
     """Handles joystick connection and input reading with hotplug support."""
@@ -20,6 +29,14 @@ class JoystickHandler(QtCore.QObject):
         self.j = None
         self.name = "None"
 
+        # Last state returned by read(), and the joystick it was read from.
+        # Once input events are seen to arrive, read() only queries the
+        # device again after an event says something changed.
+        self._axes = []
+        self._btns = []
+        self._state_joystick = None
+        self._input_events_seen = False
+
         # Pygame 2 provides joystick hotplug events
         self._joy_events_supported = hasattr(pygame, "JOYDEVICEADDED") and hasattr(
             pygame, "JOYDEVICEREMOVED"
@@ -122,19 +139,30 @@ class JoystickHandler(QtCore.QObject):
             - axes: List of axis values (-1.0 to 1.0), includes hat as last 2 axes (x, y)
             - buttons: List of button states (0 or 1)
         """
-        # Prefer hotplug events if available for immediate reconnect
+        # Until input events have been seen, poll the device on every read
+        changed = not self._input_events_seen
+        # Prefer hotplug events if available for immediate reconnect. The whole
+        # queue is drained so input events don't pile up in SDL's queue.
         if self._joy_events_supported:
             try:
-                for ev in pygame.event.get([pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED]):
-                    if ev.type == pygame.JOYDEVICEADDED:
+                for ev in pygame.event.get():
+                    if ev.type in JOY_INPUT_EVENTS:
+                        changed = self._input_events_seen = True
+                    elif ev.type == pygame.JOYDEVICEADDED:
                         self._handle_device_added(getattr(ev, "device_index", 0))
                     elif ev.type == pygame.JOYDEVICEREMOVED:
                         self._handle_device_removed(getattr(ev, "instance_id", None))
             except Exception:
                 # Fall back to simple pumping if anything goes wrong
                 pygame.event.pump()
+                changed = True
         else:
             pygame.event.pump()
+            changed = True
+
+        # Hotplug handling and the periodic scan can swap the device
+        if not changed and self.j is self._state_joystick:
+            return self._axes, self._btns
 
         axes, btns = [], []
         if self.j:
@@ -155,4 +183,8 @@ class JoystickHandler(QtCore.QObject):
                 self.name = "None"
                 # Trigger a quick rescan
                 self._scan()
+                # Not cached, so the next call reads whatever the rescan found
+                return axes, btns
+        self._axes, self._btns = axes, btns
+        self._state_joystick = self.j
         return axes, btns
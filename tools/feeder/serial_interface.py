@@ -10,7 +10,6 @@ with the ELRS module, including:
 """
 
 import time
-import struct
 import threading
 import serial
 from PyQt5 import QtCore
@@ -35,6 +34,7 @@ from crsf_protocol import (
     build_crsf_channels_frame,
     crsf_val_to_us,
     unpack_crsf_channels,
+    unpack_link_statistics,
 )
 
 from device_parameters import (
@@ -45,6 +45,9 @@ from device_parameters import (
 # Constants from main feeder module
 CHANNELS = 16
 SEND_HZ = 60
+# Received channels and link statistics are handed to the GUI at most this
+# often (seconds); only the newest of each is emitted
+UI_EMIT_INTERVAL = 0.033
 
 
 class SerialThread(QtCore.QObject):
@@ -59,7 +62,7 @@ class SerialThread(QtCore.QObject):
     - Channel data transmission and reception
 
     Signals:
-        telemetry: Emitted with link statistics dict
+        telemetry: Emitted with a LinkStats tuple of link statistics
         debug: Emitted with debug/log messages
         channels_update: Emitted with list of 16 channel values (microseconds)
         sync_update: Emitted with (interval_us, offset_us, src) for timing sync
@@ -70,7 +73,7 @@ class SerialThread(QtCore.QObject):
         device_parameter_field_updated: Emitted with (src, field_id, parsed_field)
     """
 
-    telemetry = QtCore.pyqtSignal(dict)
+    telemetry = QtCore.pyqtSignal(object)
     debug = QtCore.pyqtSignal(str)
     channels_update = QtCore.pyqtSignal(list)
     # (interval_us, offset_us, src) - include src address so UI can associate heartbeat
@@ -81,16 +84,21 @@ class SerialThread(QtCore.QObject):
     device_parameters_progress = QtCore.pyqtSignal(int, int, int)  # src, fetched_count, total_count
     device_parameter_field_updated = QtCore.pyqtSignal(int, int, dict)  # src, fid, parsed field
 
-    def __init__(self, port, baud):
+    def __init__(self, port, baud, read_timeout=0.001, low_latency=True):
         """Initialize the serial thread.
 
         Args:
             port: Serial port name (e.g., 'COM3' or '/dev/ttyUSB0')
             baud: Baud rate (typically 5250000 for ELRS)
+            read_timeout: Seconds a read waits for the first byte. The send loop
+                shares this thread, so keep it below the shortest send interval.
+            low_latency: Request ASYNC_LOW_LATENCY on the port (Linux only)
         """
         super().__init__()
         self.port = port
         self.baud = baud
+        self.read_timeout = read_timeout
+        self.low_latency = low_latency
         self.ser = None
         self.running = True
         self._last_status = False
@@ -133,6 +141,11 @@ class SerialThread(QtCore.QObject):
         # Track last link stats packet time
         self.last_link_stats_time = 0.0
 
+        # Newest received channels / link stats not yet emitted to the GUI
+        self._pending_channels = None
+        self._pending_link_stats = None
+        self._last_ui_emit = 0.0
+
         # Don't connect here; let the Main class connect the signal first
 
     def _connect(self):
@@ -143,7 +156,9 @@ class SerialThread(QtCore.QObject):
                     self.ser.close()
                 except:
                     pass
-            self.ser = serial.Serial(self.port, self.baud, timeout=0.05)
+            self.ser = serial.Serial(self.port, self.baud, timeout=self.read_timeout)
+            if self.low_latency:
+                self._apply_low_latency()
             # Flush any stale data from the input buffer (module may have buffered responses)
             self.ser.reset_input_buffer()
             self.debug.emit(f"Connected to {self.port} @ {self.baud} baud")
@@ -158,6 +173,17 @@ class SerialThread(QtCore.QObject):
             except Exception:
                 pass
 
+    def _apply_low_latency(self):
+        """Ask the driver to deliver received bytes without batching them.
+
+        Only pyserial's POSIX backend supports this, and drivers without the
+        ASYNC_LOW_LATENCY flag reject it; either way the port is still usable.
+        """
+        try:
+            self.ser.set_low_latency_mode(True)
+        except (AttributeError, ValueError, OSError):
+            pass
+
     def _update_status(self):
         """Emit connection status if it changed."""
         is_connected = self.ser is not None
@@ -225,7 +251,9 @@ class SerialThread(QtCore.QObject):
                 time.sleep(0.5)
                 continue
             try:
-                data = self.ser.read(256)
+                # Wait up to read_timeout for the first byte, then take whatever
+                # else is already buffered; the OS wakes us as soon as data arrives
+                data = self.ser.read(self.ser.in_waiting or 1)
                 if data:
                     buf.extend(data)
                     # Parse CRSF frames from USB->ELRS forwarder
@@ -250,8 +278,6 @@ class SerialThread(QtCore.QObject):
                         else:
                             # CRC mismatch — drop one byte and try again
                             del buf[0]
-                else:
-                    time.sleep(0.001)
             except Exception as e:
                 self.ser = None
                 self._update_status()
@@ -261,6 +287,8 @@ class SerialThread(QtCore.QObject):
                     pass
                 time.sleep(0.2)
 
+            self._emit_pending_ui()
+
             # --- Periodic CRSF send based on configured interval (µs) ---
             try:
                 now = time.perf_counter()
@@ -344,6 +372,26 @@ class SerialThread(QtCore.QObject):
             except Exception as e:
                 self.debug.emit(f"Discovery/param state error: {e}")
 
+    def _emit_pending_ui(self):
+        """Emit the newest received channels and link stats, throttled.
+
+        Frames can arrive far faster than the GUI repaints, and every emit is
+        a queued cross-thread call, so at most one of each goes out per
+        UI_EMIT_INTERVAL.
+        """
+        if self._pending_channels is None and self._pending_link_stats is None:
+            return
+        now = time.monotonic()
+        if now - self._last_ui_emit < UI_EMIT_INTERVAL:
+            return
+        self._last_ui_emit = now
+        if self._pending_channels is not None:
+            self.channels_update.emit(self._pending_channels)
+            self._pending_channels = None
+        if self._pending_link_stats is not None:
+            self.telemetry.emit(self._pending_link_stats)
+            self._pending_link_stats = None
+
     def _handle_frame(self, t, payload):
         """Handle a parsed CRSF frame.
 
@@ -377,26 +425,13 @@ class SerialThread(QtCore.QObject):
                 self.debug.emit(f"auto discovery trigger error: {e}")
 
         if t == CRSF_FRAMETYPE_LINK_STATISTICS and len(payload) >= 10:
-            # crsf_link_statistics_t (10 bytes)
-            r = {
-                "1RSS": int(struct.unpack("b", payload[0:1])[0]),
-                "2RSS": int(struct.unpack("b", payload[1:2])[0]),
-                "LQ": payload[2],
-                "RSNR": int(struct.unpack("b", payload[3:4])[0]),
-                "RFMD": payload[5] if len(payload) > 5 else 0,
-                "TPWR": payload[6] if len(payload) > 6 else 0,
-                "TRSS": int(struct.unpack("b", payload[7:8])[0]) if len(payload) > 7 else 0,
-                "TLQ": payload[8] if len(payload) > 8 else 0,
-                "TSNR": int(struct.unpack("b", payload[9:10])[0]) if len(payload) > 9 else 0,
-                "FLAGS": payload[4] if len(payload) > 4 else 0,
-            }
-            self.telemetry.emit(r)
-            self.last_link_stats_time = time.time()
+            self._pending_link_stats = unpack_link_statistics(payload)
+            self.last_link_stats_time = time.monotonic()
         elif t == CRSF_FRAMETYPE_RC_CHANNELS_PACKED and len(payload) >= 22:
             # Unpack 16 channels from 22-byte CRSF payload
             chans = unpack_crsf_channels(payload)
-            # Emit channels (microseconds) via a dedicated signal so the GUI can update controls
-            self.channels_update.emit(chans)
+            # Emitted (microseconds) via channels_update by _emit_pending_ui
+            self._pending_channels = chans
         elif t == CRSF_FRAMETYPE_HANDSET and len(payload) >= 11:
             # Extended handset frame: payload[0]=dest, payload[1]=orig, payload[2]=subType
             sub = payload[2]